@@ -0,0 +1,87 @@
+"""Concurrent chapter generation shared by the engine adapters.
+
+The engines expose a synchronous iterator over generated chapters, but
+generate them on a private asyncio event loop so that several requests can
+be in flight at once. This module drives that loop.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def _event_loop_running() -> bool:
+    """Return whether an asyncio event loop is running in this thread."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def iter_concurrently(
+    jobs: Iterable[Callable[[], Awaitable[T]]],
+    limit: int,
+    close: Optional[Callable[[], Awaitable[object]]] = None
+) -> Iterator[T]:
+    """Run async jobs on a private event loop, yielding results as they finish.
+
+    At most ``limit`` jobs run at once. This also works when called from
+    code that is already running an event loop. Jobs still running when the
+    caller stops iterating early are cancelled.
+
+    Args:
+        jobs: Functions that each return the coroutine for one job.
+        limit: Maximum number of jobs running at once.
+        close: Optional function returning a coroutine that releases shared
+            resources, such as the async client; awaited once at the end.
+
+    Yields:
+        The result of each job, in completion order.
+    """
+    loop = asyncio.new_event_loop()
+    executor = None
+    if _event_loop_running():
+        # The private loop cannot run nested inside the caller's running
+        # loop (e.g. Jupyter or an async server), so drive it from a
+        # worker thread instead
+        executor = ThreadPoolExecutor(max_workers=1)
+
+    def run(coro):
+        if executor is None:
+            return loop.run_until_complete(coro)
+        return executor.submit(loop.run_until_complete, coro).result()
+
+    async def start():
+        # Created on the loop that uses it: before Python 3.10, asyncio
+        # primitives bind to the current loop when they are constructed
+        semaphore = asyncio.Semaphore(limit)
+
+        async def limited(job):
+            async with semaphore:
+                return await job()
+
+        return {loop.create_task(limited(job)) for job in jobs}
+
+    pending = set()
+    try:
+        pending = run(start())
+        while pending:
+            done, pending = run(
+                asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        # Also reached when the caller stops iterating early
+        for task in pending:
+            task.cancel()
+        if pending:
+            run(asyncio.gather(*pending, return_exceptions=True))
+        if close is not None:
+            run(close())
+        loop.close()
+        if executor is not None:
+            executor.shutdown()
@@ -15,18 +15,23 @@ The engine supports:
 import os
 import re
 import logging
-from typing import Dict, List, Tuple, Optional, Callable
-from ollama import Client
+import string
+import threading
+from functools import cached_property, lru_cache, partial
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Tuple, Optional, Callable
+from ollama import AsyncClient, Client
 from ollama._types import ResponseError
 from alive_progress import alive_bar
+from core.domain.entities import Chapter
 from core.ports import CompletionEnginePort
-
-# ANSI color codes
-GRAY = "\033[90m"
-ORANGE = "\033[33m"  # Orange color
-RED = "\033[31m"    # Red color
-CYAN = "\033[36m"   # Cyan color
-RESET = "\033[0m"
+from adapters.engines.concurrency import iter_concurrently
+from adapters.engines.ollama_adapter.cache import _ResponseCache
+from adapters.engines.ollama_adapter.stream import (
+    CYAN, GRAY, ORANGE, RED, RESET,
+    _StreamEcho, _ThinkStripper, _stdout_supports_color
+)
 
 
 class OllamaEngineError(Exception):
@@ -43,6 +48,156 @@ class OllamaResponseError(OllamaEngineError):
 
 logger = logging.getLogger(__name__)
 MAX_ITERATIONS = 3
+# Reply from the main model accepting a draft model's chapter as it is
+DRAFT_APPROVED = "APPROVED"
+# Follow-up asking the main model to review a draft model's chapter. It
+# answers with a short verdict rather than the chapter itself, since
+# decoding the whole chapter again would cost as much as writing it
+DRAFT_REVIEW_PROMPT = (
+    "Review the draft above for technical correctness and completeness. "
+    f"If it needs no changes, reply with only the word {DRAFT_APPROVED}. "
+    "Otherwise list only the specific corrections needed, briefly, "
+    "without rewriting the chapter."
+)
+# Follow-up asking the draft model to apply the main model's corrections
+DRAFT_REVISE_PROMPT = (
+    "Apply these corrections to the chapter above and output the final "
+    "chapter in exactly the same format, with no additional commentary.\n\n"
+    "{corrections}"
+)
+# Default number of chapters generated concurrently (OLLAMA_PARALLEL)
+DEFAULT_CONCURRENCY = 4
+
+# Precompiled patterns used to parse model responses
+_TITLE_SECTIONS_RE = re.compile(
+    r"<TITLE_BLOCK>(?P<block>.*?)</TITLE_BLOCK>"
+    r"|<TITLE_OVERVIEW>(?P<overview>.*?)</TITLE_OVERVIEW>",
+    re.DOTALL | re.IGNORECASE
+)
+# Matches lines like: 1. Decorators for Advanced Functionality | Decorators
+_TITLE_LINE_RE = re.compile(
+    r"^[^\S\n]*(.*?)[^\S\n]*\|[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE
+)
+
+
+@lru_cache(maxsize=None)
+def _list_prompt_templates(kind_dir: Path) -> Dict[str, Path]:
+    """Return the .txt templates in a directory, keyed by base model name.
+
+    The directory is listed once per process; a missing directory yields an
+    empty table.
+
+    Args:
+        kind_dir: The directory holding the templates of one kind.
+
+    Returns:
+        A mapping of base model name to template path.
+    """
+    try:
+        return {
+            path.stem: path for path in kind_dir.iterdir() if path.suffix == ".txt"
+        }
+    except FileNotFoundError:
+        return {}
+
+
+@lru_cache(maxsize=None)
+def _resolve_prompt_path(prompt_dir: Path, base_model: str, kind: str) -> Path:
+    """Return the prompt template file of the given kind for a model.
+
+    Falls back to llama.txt when there is no model-specific template. The
+    templates are looked up in the cached directory listing, and the result
+    is cached per model and kind.
+
+    Args:
+        prompt_dir: The category prompt directory (e.g. prompts/common).
+        base_model: The model name without tag or version suffix.
+        kind: The template kind, either "titles" or "content".
+
+    Returns:
+        The path of the template file to use.
+    """
+    kind_dir = prompt_dir / kind
+    templates = _list_prompt_templates(kind_dir)
+    prompt_path = templates.get(base_model)
+    if prompt_path is None:
+        prompt_path = kind_dir / "llama.txt"
+        logger.warning(
+            "Model-specific %s template not found for %s, "
+            "falling back to llama.txt",
+            kind,
+            base_model
+        )
+
+    logger.debug(
+        "%sUsing %s prompt file: %s%s",
+        CYAN,
+        kind,
+        prompt_path,
+        RESET
+    )
+    return prompt_path
+
+
+@lru_cache(maxsize=32)
+def _read_prompt_template(prompt_path: Path) -> str:
+    """Read a prompt template file.
+
+    The result is cached by path, so a file shared by several models (such
+    as the llama.txt fallback) is only read once per process.
+
+    Args:
+        prompt_path: The template file to read.
+
+    Returns:
+        The raw template text.
+
+    Raises:
+        OllamaPromptError: If the template cannot be read.
+    """
+    try:
+        return prompt_path.read_text(encoding="utf-8")
+    except Exception as exc:
+        raise OllamaPromptError(
+            f"Failed to load prompt template from {prompt_path}. "
+            f"Error: {str(exc)}"
+        ) from exc
+
+
+def _load_prompt_template(prompt_dir: Path, base_model: str, kind: str) -> str:
+    """Return the prompt template text of the given kind for a model.
+
+    Args:
+        prompt_dir: The category prompt directory (e.g. prompts/common).
+        base_model: The model name without tag or version suffix.
+        kind: The template kind, either "titles" or "content".
+
+    Returns:
+        The raw template text.
+
+    Raises:
+        OllamaPromptError: If the template cannot be read.
+    """
+    return _read_prompt_template(
+        _resolve_prompt_path(prompt_dir, base_model, kind)
+    )
+
+
+class _PromptTemplate(string.Template):
+    """string.Template using the {{NAME}} placeholders of the prompt files.
+
+    All placeholders are rendered in a single pass; unknown ones are left
+    untouched by safe_substitute().
+    """
+    flags = 0
+    pattern = r"""
+    \{\{(?:
+        (?P<named>[_A-Z][_A-Z0-9]*)\}\} |
+        (?P<braced>(?!)) |
+        (?P<escaped>(?!)) |
+        (?P<invalid>(?!))
+    )
+    """
 
 
 class OllamaEngine(CompletionEnginePort):
@@ -61,6 +216,7 @@ class OllamaEngine(CompletionEnginePort):
         expertise_level (str): The expertise level for the generated content.
         context_note (str): The context note based on expertise level.
         tokens_used (int): Counter for tokens used in generation.
+        concurrency (int): Maximum number of chapters generated at once.
     """
 
     level_descriptions: Dict[str, str] = {
@@ -77,6 +233,21 @@ class OllamaEngine(CompletionEnginePort):
             "optimized solutions."
         )
     }
+    # Case-folded expertise level -> (level, description)
+    _LEVEL_LOOKUP: Dict[str, Tuple[str, str]] = {
+        level.casefold(): (level, description)
+        for level, description in level_descriptions.items()
+    }
+
+    # Shared, read-only system message; the client copies messages it sends
+    _SYSTEM_MSG: Mapping[str, str] = MappingProxyType(
+        {"role": "system", "content": "You are a helpful AI assistant."}
+    )
+
+    # Sync clients shared by all engines, keyed by host, so their HTTP
+    # connection pools are reused across instances
+    _clients: Dict[Optional[str], Client] = {}
+    _clients_lock = threading.Lock()
 
     def __init__(
         self,
@@ -87,7 +258,10 @@ class OllamaEngine(CompletionEnginePort):
         expertise_level: str = "Novice",
         think: bool = True,
         debug: bool = False,
-        progress_bar: bool = False
+        progress_bar: bool = False,
+        concurrency: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        draft_model: Optional[str] = None
     ) -> None:
         """Initialize the Ollama engine.
 
@@ -100,103 +274,139 @@ class OllamaEngine(CompletionEnginePort):
             think: Whether to show thinking process
             debug: Whether to show debug output
             progress_bar: Whether to show progress bar
+            concurrency: Maximum number of chapters generated at once.
+                Defaults to the OLLAMA_PARALLEL environment variable, or 4.
+            cache_dir: Directory to cache model responses in. Identical
+                requests are then answered from disk. Disabled if None.
+            draft_model: Optional smaller Ollama model that drafts each
+                chapter; the main model then only reviews it.
         """
         self.model = model
+        self.draft_model = draft_model
         self.host = host
         self.stream = stream
         self.category = category
         self.progress_bar = progress_bar
 
-        # Normalize expertise level to title case
-        normalized_level = expertise_level.title()
-        if normalized_level not in self.level_descriptions:
+        # Match the expertise level case-insensitively
+        entry = self._LEVEL_LOOKUP.get(expertise_level.casefold())
+        if entry is None:
             raise ValueError(
                 f"Invalid expertise level: {expertise_level}. "
                 f"Must be one of: {', '.join(self.level_descriptions.keys())}"
             )
-        self.expertise_level = normalized_level
-        self.context_note = self.level_descriptions[self.expertise_level]
+        self.expertise_level, self.context_note = entry
 
         self.think = think
         self.debug = debug
+        self._use_color = _stdout_supports_color()
         self.tokens_used = 0
         self.quantity = 5  # Default quantity
+        if concurrency is None:
+            parallel = os.getenv("OLLAMA_PARALLEL", str(DEFAULT_CONCURRENCY))
+            try:
+                concurrency = int(parallel)
+            except ValueError:
+                logger.warning(
+                    "Invalid OLLAMA_PARALLEL value %r, using %d",
+                    parallel, DEFAULT_CONCURRENCY
+                )
+                concurrency = DEFAULT_CONCURRENCY
+        self.concurrency = max(1, concurrency)
+        self._cache = _ResponseCache(Path(cache_dir)) if cache_dir else None
+
+        # The Ollama client and prompt templates are created lazily, on first use
+        self._base_model = (
+            self.model.partition(":")[0].partition(".")[0].lower()
+        )
+        # Determine prompt directory based on category
+        prompt_subdir = "course" if self.category.lower() == "course" else "common"
+        self._prompt_dir = Path(__file__).parent / "prompts" / prompt_subdir
 
+    @classmethod
+    def _get_client(cls, host: Optional[str]) -> Client:
+        """Return the shared Ollama client for a host, creating it if needed.
+
+        Args:
+            host: The Ollama server URL, or None for the default.
+
+        Returns:
+            The client used by every engine targeting that host.
+        """
+        client = cls._clients.get(host)
+        if client is None:
+            with cls._clients_lock:
+                client = cls._clients.get(host)
+                if client is None:
+                    # Create a custom Ollama client with the specified host
+                    client = Client(host=host) if host else Client()
+                    cls._clients[host] = client
+        return client
+
+    @cached_property
+    def ollama(self) -> Client:
+        """The sync Ollama client for this engine's host.
+
+        Raises:
+            OllamaEngineError: If the client cannot be created.
+        """
         try:
-            # Create a custom Ollama client with the specified host
-            self.ollama = Client(host=host) if host else Client()
+            return self._get_client(self.host)
         except Exception as exc:
             raise OllamaEngineError(
-                f"Failed to connect to Ollama server at {host or 'default'}. "
+                f"Failed to connect to Ollama server at {self.host or 'default'}. "
                 f"Please ensure the server is running and accessible. "
                 f"Error: {str(exc)}"
             ) from exc
 
-        here = os.path.dirname(__file__)
+    @cached_property
+    def _prompt_titles_template(self) -> str:
+        """The raw titles prompt template."""
+        return _load_prompt_template(self._prompt_dir, self._base_model, "titles")
 
-        # Load prompt templates based on model
-        base_model = self.model.split(":")[0].split(".")[0].lower()
-        # Determine prompt directory based on category
-        prompt_subdir = "course" if self.category.lower() == "course" else "common"
-        # Load titles prompt template
-        titles_prompt_dir = os.path.abspath(
-            os.path.join(here, f"prompts/{prompt_subdir}/titles")
-        )
-        titles_prompt_path = os.path.join(
-            titles_prompt_dir, f"{base_model}.txt"
-        )
-        if not os.path.exists(titles_prompt_path):
-            titles_prompt_path = os.path.join(titles_prompt_dir, "llama.txt")
-            logger.warning(
-                "Model-specific prompt template not found for %s, "
-                "falling back to llama.txt",
-                base_model
-            )
+    @cached_property
+    def prompt_detail_template(self) -> str:
+        """The raw content prompt template."""
+        return _load_prompt_template(self._prompt_dir, self._base_model, "content")
 
-        logger.debug(
-            "%sUsing titles prompt file: %s%s",
-            CYAN,
-            titles_prompt_path,
-            RESET
-        )
-        try:
-            with open(titles_prompt_path, encoding="utf-8") as file:
-                self._prompt_titles_template = file.read()
-        except Exception as exc:
-            raise OllamaPromptError(
-                f"Failed to load titles prompt template from "
-                f"{titles_prompt_path}. Error: {str(exc)}"
-            ) from exc
+    @cached_property
+    def _titles_template(self) -> _PromptTemplate:
+        """The parsed titles prompt template."""
+        return _PromptTemplate(self._prompt_titles_template)
 
-        # Load content prompt template
-        content_prompt_dir = os.path.abspath(
-            os.path.join(here, f"prompts/{prompt_subdir}/content")
-        )
-        content_prompt_path = os.path.join(
-            content_prompt_dir, f"{base_model}.txt"
-        )
-        if not os.path.exists(content_prompt_path):
-            content_prompt_path = os.path.join(content_prompt_dir, "llama.txt")
-            logger.warning(
-                "Model-specific content template not found for %s, "
-                "falling back to llama.txt",
-                base_model
-            )
+    @cached_property
+    def _detail_template(self) -> _PromptTemplate:
+        """The parsed content prompt template."""
+        return _PromptTemplate(self.prompt_detail_template)
 
-        logger.debug(
-            "%sUsing content prompt file: %s%s",
-            CYAN,
-            content_prompt_path,
-            RESET
-        )
-        try:
-            with open(content_prompt_path, encoding="utf-8") as file:
-                self.prompt_detail_template = file.read()
-        except Exception as exc:
-            raise OllamaPromptError(
-                f"Failed to load content prompt template from "
-                f"{content_prompt_path}. Error: {str(exc)}"
-            ) from exc
+    def _paint(self, text: str, color: str = GRAY) -> str:
+        """Wrap text in an ANSI color when stdout supports colors.
+
+        Args:
+            text: The text to color.
+            color: ANSI color code to display the text with.
+
+        Returns:
+            The colored text, or the text unchanged when colors are disabled.
+        """
+        if not self._use_color:
+            return text
+        return f"{color}{text}{RESET}"
+
+    def _record_tokens(
+        self, word_count: int, eval_count: Optional[int]
+    ) -> None:
+        """Add the tokens used by one response to tokens_used.
+
+        Args:
+            word_count: Number of words in the raw (unstripped) response.
+            eval_count: Number of generated tokens reported by Ollama, if any.
+        """
+        if eval_count:
+            self.tokens_used += eval_count
+        else:
+            # Estimate the token usage from the word count
+            self.tokens_used += int(word_count * 0.75)
 
     def build_titles_prompt(self, topic: str) -> str:
         """Build the prompt for generating chapter titles.
@@ -207,13 +417,13 @@ class OllamaEngine(CompletionEnginePort):
         Returns:
             The formatted prompt string.
         """
-        prompt = self._prompt_titles_template
-        prompt = prompt.replace("{{TOPIC}}", topic)
-        prompt = prompt.replace("{{QUANTITY}}", str(self.quantity))
-        prompt = prompt.replace("{{CATEGORY}}", self.category)
-        prompt = prompt.replace("{{EXPERTISE_LEVEL}}", self.expertise_level)
-        prompt = prompt.replace("{{CONTEXT_NOTE}}", self.context_note)
-        return prompt
+        return self._titles_template.safe_substitute(
+            TOPIC=topic,
+            QUANTITY=self.quantity,
+            CATEGORY=self.category,
+            EXPERTISE_LEVEL=self.expertise_level,
+            CONTEXT_NOTE=self.context_note
+        )
 
     def build_detail_prompt(
         self, topic: str, chapter_title: str, chapter_index: int,
@@ -230,16 +440,258 @@ class OllamaEngine(CompletionEnginePort):
         Returns:
             The formatted prompt string.
         """
-        prompt = self.prompt_detail_template
-        prompt = prompt.replace("{{TOPIC}}", topic)
-        prompt = prompt.replace("{{CHAPTER_TITLE}}", chapter_title)
-        prompt = prompt.replace("{{CHAPTER_SHORT_TITLE}}", chapter_short_title)
-        prompt = prompt.replace("{{CATEGORY}}", self.category)
-        prompt = prompt.replace("{{EXPERTISE_LEVEL}}", self.expertise_level)
-        prompt = prompt.replace("{{CONTEXT_NOTE}}", self.context_note)
-        prompt = prompt.replace("{{CHAPTER_INDEX}}", str(chapter_index))
-        prompt = prompt.replace("{{QUANTITY}}", str(self.quantity))
-        return prompt
+        return self._detail_template.safe_substitute(
+            TOPIC=topic,
+            CHAPTER_TITLE=chapter_title,
+            CHAPTER_SHORT_TITLE=chapter_short_title,
+            CATEGORY=self.category,
+            EXPERTISE_LEVEL=self.expertise_level,
+            CONTEXT_NOTE=self.context_note,
+            CHAPTER_INDEX=chapter_index,
+            QUANTITY=self.quantity
+        )
+
+    def _cache_lookup(
+        self, model: str, messages: List[Mapping[str, str]]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Look up a chat request in the response cache.
+
+        Args:
+            model: The model the request is sent to.
+            messages: The chat messages of the request.
+
+        Returns:
+            A tuple of the cache key (None when caching is disabled) and the
+            cached response (None on a miss).
+        """
+        if self._cache is None:
+            return None, None
+        cache_key = self._cache.key(model, self.think, messages)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Using cached response %s", cache_key)
+        return cache_key, cached
+
+    def _chat(
+        self, messages: List[Mapping[str, str]], model: Optional[str] = None
+    ) -> str:
+        """Send a chat request and return the response without think blocks.
+
+        The request is retried without thinking when the model does not
+        support it. Streamed pieces are echoed as they arrive, and the token
+        usage of the response is recorded.
+
+        Args:
+            messages: The chat messages to send.
+            model: The model to use. Defaults to the engine's model.
+
+        Returns:
+            The response content with <think> blocks removed.
+
+        Raises:
+            ResponseError: If the Ollama server rejects the request.
+        """
+        model = model or self.model
+        cache_key, cached = self._cache_lookup(model, messages)
+        if cached is not None:
+            return cached
+
+        # Streaming only pays off when the pieces are echoed as they arrive,
+        # so the stream loop below always echoes without checking debug
+        stream = self.stream and self.debug
+        chat_kwargs = {
+            "model": model,
+            "messages": messages,
+            "stream": stream
+        }
+        if not self.think:
+            chat_kwargs["think"] = False
+
+        retry_without_think = self.think
+        while True:
+            # Visible pieces are collected and joined once at the end
+            parts = []
+            # Strips <think> spans as the response streams in
+            stripper = _ThinkStripper()
+            eval_count = None
+            try:
+                if stream:
+                    echo = _StreamEcho(self._use_color)
+                    for msg in self.ollama.chat(**chat_kwargs):
+                        piece = msg['message']['content']
+                        parts.append(stripper.feed(piece))
+                        # Print with appropriate color; the stripper tracks
+                        # think tags even when they are split across pieces
+                        echo.write(piece, RED if stripper.in_think else GRAY)
+                        if msg.get('done'):
+                            eval_count = msg.get('eval_count')
+                    echo.close()
+                else:
+                    response = self.ollama.chat(**chat_kwargs)
+                    parts.append(stripper.feed(response['message']['content']))
+                    eval_count = response.get('eval_count')
+                    if self.debug:
+                        print(self._paint(response['message']['content']))
+                break
+            except ResponseError as e:
+                if "does not support thinking" in str(e) and retry_without_think:
+                    logger.warning(
+                        "Model %s does not support thinking feature. "
+                        "Retrying without thinking.",
+                        model
+                    )
+                    retry_without_think = False
+                    chat_kwargs.pop("think", None)
+                    continue
+                raise
+
+        parts.append(stripper.flush())
+        self._record_tokens(stripper.word_count, eval_count)
+        content = "".join(parts)
+        if cache_key is not None:
+            self._cache.put(cache_key, content)
+        return content
+
+    async def _achat(
+        self,
+        client: AsyncClient,
+        messages: List[Mapping[str, str]],
+        model: Optional[str] = None
+    ) -> str:
+        """Asynchronously send a chat request, mirroring _chat().
+
+        Since the output of concurrent requests would interleave, nothing is
+        echoed while the request runs: the response is requested in one
+        piece and debug output is printed once it completes.
+
+        Args:
+            client: The async Ollama client to use.
+            messages: The chat messages to send.
+            model: The model to use. Defaults to the engine's model.
+
+        Returns:
+            The response content with <think> blocks removed.
+
+        Raises:
+            ResponseError: If the Ollama server rejects the request.
+        """
+        model = model or self.model
+        cache_key, cached = self._cache_lookup(model, messages)
+        if cached is not None:
+            return cached
+
+        chat_kwargs = {
+            "model": model,
+            "messages": messages,
+            "stream": False
+        }
+        if not self.think:
+            chat_kwargs["think"] = False
+
+        retry_without_think = self.think
+        while True:
+            try:
+                response = await client.chat(**chat_kwargs)
+                break
+            except ResponseError as e:
+                if "does not support thinking" in str(e) and retry_without_think:
+                    logger.warning(
+                        "Model %s does not support thinking feature. "
+                        "Retrying without thinking.",
+                        model
+                    )
+                    retry_without_think = False
+                    chat_kwargs.pop("think", None)
+                    continue
+                raise
+
+        raw_content = response['message']['content']
+        stripper = _ThinkStripper()
+        content = stripper.feed(raw_content) + stripper.flush()
+        if self.debug:
+            print(self._paint(raw_content), flush=True)
+
+        self._record_tokens(stripper.word_count, response.get('eval_count'))
+        if cache_key is not None:
+            self._cache.put(cache_key, content)
+        return content
+
+    @staticmethod
+    def _draft_followup(
+        messages: List[Mapping[str, str]], draft: str, prompt: str
+    ) -> List[Mapping[str, str]]:
+        """Extend a chat with a draft answer and a follow-up request.
+
+        Args:
+            messages: The original chat messages.
+            draft: The draft model's answer to them.
+            prompt: The follow-up request about the draft.
+
+        Returns:
+            The messages with the draft and the follow-up appended.
+        """
+        return [
+            *messages,
+            {"role": "assistant", "content": draft},
+            {"role": "user", "content": prompt}
+        ]
+
+    @staticmethod
+    def _draft_approved(review: str) -> bool:
+        """Return whether the main model's review accepts the draft as is."""
+        return review.strip().rstrip(".!").upper() == DRAFT_APPROVED
+
+    def _draft_chapter(self, messages: List[Mapping[str, str]]) -> str:
+        """Generate a chapter with the draft model and have it reviewed.
+
+        The draft model writes the chapter and the main model only answers
+        with an approval or a short list of corrections, which the draft
+        model then applies. The main model never decodes the whole chapter.
+
+        Args:
+            messages: The chat messages requesting the chapter.
+
+        Returns:
+            The approved or corrected draft.
+        """
+        draft = self._chat(messages, model=self.draft_model)
+        review = self._chat(
+            self._draft_followup(messages, draft, DRAFT_REVIEW_PROMPT)
+        )
+        if self._draft_approved(review):
+            return draft
+        return self._chat(
+            self._draft_followup(
+                messages, draft, DRAFT_REVISE_PROMPT.format(corrections=review.strip())
+            ),
+            model=self.draft_model
+        )
+
+    async def _adraft_chapter(
+        self, client: AsyncClient, messages: List[Mapping[str, str]]
+    ) -> str:
+        """Asynchronously generate and review a draft, mirroring _draft_chapter().
+
+        Args:
+            client: The async Ollama client to use.
+            messages: The chat messages requesting the chapter.
+
+        Returns:
+            The approved or corrected draft.
+        """
+        draft = await self._achat(client, messages, model=self.draft_model)
+        review = await self._achat(
+            client, self._draft_followup(messages, draft, DRAFT_REVIEW_PROMPT)
+        )
+        if self._draft_approved(review):
+            return draft
+        return await self._achat(
+            client,
+            self._draft_followup(
+                messages, draft, DRAFT_REVISE_PROMPT.format(corrections=review.strip())
+            ),
+            model=self.draft_model
+        )
 
     def generate_chapters(
         self, topic: str
@@ -267,120 +719,41 @@ class OllamaEngine(CompletionEnginePort):
             prompt,
             RESET
         )
-        messages = [
-            {"role": "system", "content": "You are a helpful AI assistant."},
-            {"role": "user", "content": prompt}
-        ]
-
-        content = ""
-        in_think_block = False
-        try:
-            chat_kwargs = {
-                "model": self.model,
-                "messages": messages,
-                "stream": self.stream
-            }
-            if not self.think:
-                chat_kwargs["think"] = False
-
-            if self.stream:
-                for msg in self.ollama.chat(**chat_kwargs):
-                    piece = msg['message']['content']
-
-                    # Handle think tags for display only
-                    if "<think>" in piece:
-                        in_think_block = True
-                    if "</think>" in piece:
-                        in_think_block = False
-
-                    # Print with appropriate color
-                    color = RED if in_think_block else GRAY
-                    if self.debug:
-                        print(f"{color}{piece}{RESET}", end="", flush=True)
-                    content += piece
-            else:
-                response = self.ollama.chat(**chat_kwargs)
-                content = response['message']['content']
-                if self.debug:
-                    print(f"{GRAY}{content}{RESET}")
-
-        except ResponseError as e:
-            if "does not support thinking" in str(e) and self.think:
-                logger.warning(
-                    "Model %s does not support thinking feature. "
-                    "Retrying without thinking.",
-                    self.model
-                )
-                # Retry without thinking
-                chat_kwargs = {
-                    "model": self.model,
-                    "messages": messages,
-                    "stream": self.stream
-                }
-                if self.stream:
-                    for msg in self.ollama.chat(**chat_kwargs):
-                        piece = msg['message']['content']
-                        if self.debug:
-                            print(f"{GRAY}{piece}{RESET}", end="", flush=True)
-                        content += piece
-                else:
-                    response = self.ollama.chat(**chat_kwargs)
-                    content = response['message']['content']
-                    if self.debug:
-                        print(f"{GRAY}{content}{RESET}")
-            else:
-                raise
-
-        original_content = content
-        # Remove <think> tags for further processing
-        content = re.sub(
-            r'<think\b[^>]*>.*?</think>',
-            '',
-            content,
-            flags=re.DOTALL | re.IGNORECASE
-        )
-        self.tokens_used += int(len(original_content.split()) * 0.75)
+        messages = [self._SYSTEM_MSG, {"role": "user", "content": prompt}]
+        content = self._chat(messages)
 
-        # Ensure </TITLE_OVERVIEW> is present for consistent parsing
-        if ("<TITLE_OVERVIEW>" in content and
-                "</TITLE_OVERVIEW>" not in content):
+        # Ensure </TITLE_OVERVIEW> is present for consistent parsing; only
+        # the text after the last opening tag needs searching for the close
+        open_idx = content.rfind("<TITLE_OVERVIEW>")
+        if open_idx != -1 and content.find("</TITLE_OVERVIEW>", open_idx) == -1:
             content += "</TITLE_OVERVIEW>"
 
-        # Extract title block and overview using regex
-        title_block_match = re.search(
-            r"<TITLE_BLOCK>(.*?)</TITLE_BLOCK>",
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
-        overview_match = re.search(
-            r"<TITLE_OVERVIEW>(.*?)</TITLE_OVERVIEW>",
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
+        # Extract title block and overview in a single regex pass
+        title_block = overview_text = None
+        for match in _TITLE_SECTIONS_RE.finditer(content):
+            if match.group("block") is not None:
+                if title_block is None:
+                    title_block = match.group("block")
+            elif overview_text is None:
+                overview_text = match.group("overview")
+            if title_block is not None and overview_text is not None:
+                break
 
         logger.debug("Content after all regex and tag fixes:\n%s", content)
 
         chapters = []
         overview = ""
-        if not title_block_match:
+        if title_block is None:
             raise OllamaResponseError(
                 "Failed to generate chapter titles. The model's response did not "
                 "contain the expected TITLE_BLOCK format. Please try again "
                 "with a different topic or model."
             )
 
-        title_lines = title_block_match.group(1).strip().splitlines()
-        for line in title_lines:
-            # Match lines like: 1. Decorators for Advanced Functionality |
-            # Decorators
-            match = re.match(r"\s*(.*?)\s*\|\s*(.*)", line)
-            if match:
-                full_title = match.group(1).strip()
-                short_title = match.group(2).strip()
-                # If short title is empty, use the full title
-                if not short_title:
-                    short_title = full_title
-                chapters.append({"full": full_title, "short": short_title})
+        for match in _TITLE_LINE_RE.finditer(title_block):
+            full_title, short_title = match.groups()
+            # If short title is empty, use the full title
+            chapters.append({"full": full_title, "short": short_title or full_title})
 
         if not chapters:
             raise OllamaResponseError(
@@ -388,10 +761,10 @@ class OllamaEngine(CompletionEnginePort):
                 "The response format was not as expected. Please try again."
             )
 
-        if not overview_match:
+        if overview_text is None:
             logger.warning("TITLE_OVERVIEW not found in model output.")
         else:
-            overview = overview_match.group(1).strip()
+            overview = overview_text.strip()
 
         # Log extracted chapters and overview
         logger.debug("Extracted chapters: %s, overview: %s", chapters, overview)
@@ -429,127 +802,166 @@ class OllamaEngine(CompletionEnginePort):
             RESET
         )
         messages = [{"role": "user", "content": prompt}]
-        content = ""
         logger.debug("Processing Chapter #%d of %d (Attempt 1)",
                     chapter_index, total_chapters)
 
-        in_think_block = False
-        try:
-            chat_kwargs = {
-                "model": self.model,
-                "messages": messages,
-                "stream": self.stream
-            }
-            if not self.think:
-                chat_kwargs["think"] = False
-
-            if self.stream:
-                for msg in self.ollama.chat(**chat_kwargs):
-                    piece = msg['message']['content']
-
-                    # Handle think tags for display only
-                    if "<think>" in piece:
-                        in_think_block = True
-                    if "</think>" in piece:
-                        in_think_block = False
-
-                    # Print with appropriate color
-                    color = RED if in_think_block else GRAY
-                    if self.debug:
-                        print(f"{color}{piece}{RESET}", end="", flush=True)
-                    content += piece
-            else:
-                response = self.ollama.chat(**chat_kwargs)
-                content = response['message']['content']
-                if self.debug:
-                    print(f"{GRAY}{content}{RESET}")
-
-        except ResponseError as e:
-            if "does not support thinking" in str(e) and self.think:
-                logger.warning(
-                    "Model %s does not support thinking feature. "
-                    "Retrying without thinking.",
-                    self.model
-                )
-                # Retry without thinking
-                chat_kwargs = {
-                    "model": self.model,
-                    "messages": messages,
-                    "stream": self.stream
-                }
-                if self.stream:
-                    for msg in self.ollama.chat(**chat_kwargs):
-                        piece = msg['message']['content']
-                        if self.debug:
-                            print(f"{GRAY}{piece}{RESET}", end="", flush=True)
-                        content += piece
-                else:
-                    response = self.ollama.chat(**chat_kwargs)
-                    content = response['message']['content']
-                    if self.debug:
-                        print(f"{GRAY}{content}{RESET}")
-            else:
-                raise
+        if self.draft_model:
+            content = self._draft_chapter(messages)
+        else:
+            content = self._chat(messages)
+        logger.debug("\n[End of Ollama Streaming Output]")
+
+        return content
+
+    async def _agenerate_content(
+        self, client: AsyncClient, topic: str, chapter_title: str,
+        chapter_index: int, total_chapters: int, chapter_short_title: str
+    ) -> str:
+        """Asynchronously generate detailed content for a specific chapter.
 
-        # Save original content for token counting
-        original_content = content
+        This mirrors generate_content() but runs on an AsyncClient so that
+        several chapters can be generated concurrently.
+
+        Args:
+            client: The async Ollama client to use.
+            topic: The topic to generate content for.
+            chapter_title: The title of the chapter to generate content for.
+            chapter_index: The index of the current chapter being generated.
+            total_chapters: The total number of chapters being generated.
+            chapter_short_title: The short version of the chapter title.
 
-        # Remove <think> tags for further processing
-        content = re.sub(
-            r'<think\b[^>]*>.*?</think>',
-            '',
-            content,
-            flags=re.DOTALL | re.IGNORECASE
+        Returns:
+            The generated chapter content as a string.
+        """
+        prompt = self.build_detail_prompt(
+            topic, chapter_title, chapter_index, chapter_short_title
         )
-        logger.debug("\n[End of Ollama Streaming Output]")
+        logger.debug(
+            "----Prompt BEGIN----\n"
+            "%s%s%s\n"
+            "----Prompt END----",
+            ORANGE,
+            prompt,
+            RESET
+        )
+        messages = [{"role": "user", "content": prompt}]
+        logger.debug("Processing Chapter #%d of %d (Attempt 1)",
+                    chapter_index, total_chapters)
 
-        # Estimate and log the token usage using the original content
-        self.tokens_used += int(len(original_content.split()) * 0.75)
+        if self.draft_model:
+            content = await self._adraft_chapter(client, messages)
+        else:
+            content = await self._achat(client, messages)
+        logger.debug("\n[End of Ollama Output for Chapter #%d]", chapter_index)
 
         return content
 
+    def iter_details(
+        self,
+        topic: str,
+        chapters: List[Dict[str, str]],
+        progress: Optional[Callable] = None
+    ) -> Iterator[Chapter]:
+        """Generate the content of all chapters, yielding each as it is done.
+
+        Chapters are generated concurrently when ``self.concurrency`` allows
+        it, in which case they are yielded in completion order; otherwise
+        they are generated one after another (with live streamed output).
+        At most ``self.concurrency`` requests are in flight at once; the
+        Ollama server queues anything beyond its own OLLAMA_NUM_PARALLEL.
+        This also works when called from code that is already running an
+        event loop.
+
+        Args:
+            topic: The topic to generate content for.
+            chapters: The chapters returned by generate_chapters().
+            progress: Optional alive_bar handle to advance per chapter.
+
+        Yields:
+            Each generated chapter as soon as it completes.
+        """
+        total_chapters = len(chapters)
+        if self.concurrency <= 1 or total_chapters <= 1:
+            for i, chapter in enumerate(chapters, 1):
+                if progress:
+                    progress.text(f"Processing: {chapter['short']}")
+                detail = self.generate_content(
+                    topic,
+                    chapter["full"],
+                    i,
+                    total_chapters,
+                    chapter["short"]
+                )
+                if progress:
+                    progress()
+                yield Chapter(chapter["full"], chapter["short"], detail, i)
+            return
+
+        client = AsyncClient(host=self.host) if self.host else AsyncClient()
+
+        async def worker(index: int, chapter: Dict[str, str]) -> Chapter:
+            if progress:
+                progress.text(f"Processing: {chapter['short']}")
+            detail = await self._agenerate_content(
+                client,
+                topic,
+                chapter["full"],
+                index,
+                total_chapters,
+                chapter["short"]
+            )
+            if progress:
+                progress()
+            return Chapter(chapter["full"], chapter["short"], detail, index)
+
+        yield from iter_concurrently(
+            (partial(worker, i, chapter) for i, chapter in enumerate(chapters, 1)),
+            self.concurrency,
+            client.close
+        )
+
+    def _generate_details(
+        self,
+        topic: str,
+        chapters: List[Dict[str, str]],
+        progress: Optional[Callable] = None
+    ) -> List[Chapter]:
+        """Generate the content of all chapters.
+
+        Args:
+            topic: The topic to generate content for.
+            chapters: The chapters returned by generate_chapters().
+            progress: Optional alive_bar handle to advance per chapter.
+
+        Returns:
+            The generated chapters in chapter order.
+        """
+        return sorted(
+            self.iter_details(topic, chapters, progress),
+            key=lambda chapter: chapter.index
+        )
+
     def generate(
         self,
         topic: str
-    ) -> Tuple[List[Tuple[int, Dict[str, str], str]], str]:
+    ) -> Tuple[List[Chapter], str]:
         """Generate a complete set of chapters with their content."""
         # Generate chapters
         if self.progress_bar:
             print("Generating chapter titles...")
         chapters, overview = self.generate_chapters(topic)
 
-        details = []
-        total_chapters = len(chapters)
-
         # Generate content for each chapter
         if self.progress_bar:
             with alive_bar(
-                total_chapters,
+                len(chapters),
                 title="Generating content",
                 bar="smooth",
                 spinner="waves",
                 enrich_print=False
             ) as progress:
-                for i, chapter in enumerate(chapters, 1):
-                    progress.text(f"Processing: {chapter['short']}")
-                    detail = self.generate_content(
-                        topic,
-                        chapter["full"],
-                        i,
-                        total_chapters,
-                        chapter["short"]
-                    )
-                    details.append((i, chapter, detail))
-                    progress()   # pylint: disable=not-callable
+                details = self._generate_details(topic, chapters, progress)
         else:
-            for i, chapter in enumerate(chapters, 1):
-                detail = self.generate_content(
-                    topic,
-                    chapter["full"],
-                    i,
-                    total_chapters,
-                    chapter["short"]
-                )
-                details.append((i, chapter, detail))
+            details = self._generate_details(topic, chapters)
 
         return details, overview
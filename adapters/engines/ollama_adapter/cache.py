@@ -0,0 +1,65 @@
+"""On-disk response cache for the Ollama engine."""
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import List, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _ResponseCache:
+    """Disk cache of model responses, one file per request.
+
+    Responses are keyed by a hash of the model, think setting and chat
+    messages, and stored with <think> blocks already removed.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._dir = directory
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(model: str, think: bool, messages: List[Mapping[str, str]]) -> str:
+        """Return the cache key of a chat request.
+
+        Args:
+            model: The model the request is sent to.
+            think: Whether thinking is enabled for the request.
+            messages: The chat messages of the request.
+
+        Returns:
+            A hex digest identifying the request.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{model}\0{think}".encode("utf-8"))
+        for message in messages:
+            digest.update(
+                f"\0{message['role']}\0{message['content']}".encode("utf-8")
+            )
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss.
+
+        An entry that cannot be read or decoded is treated as a miss, so it
+        is regenerated and overwritten.
+        """
+        path = self._dir / f"{key}.md"
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except (OSError, UnicodeDecodeError) as exc:
+            logger.warning("Ignoring unreadable cache entry %s: %s", path, exc)
+            return None
+
+    def put(self, key: str, content: str) -> None:
+        """Store the response for a key."""
+        path = self._dir / f"{key}.md"
+        # Write to a temporary file first so readers never see partial files
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
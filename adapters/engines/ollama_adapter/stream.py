@@ -0,0 +1,201 @@
+"""Streaming helpers for the Ollama engine.
+
+Removes <think> blocks from responses as they stream in and echoes streamed
+pieces to the terminal for debugging.
+"""
+
+import os
+import re
+import sys
+import time
+from typing import List
+
+# ANSI color codes
+GRAY = "\033[90m"
+ORANGE = "\033[33m"  # Orange color
+RED = "\033[31m"    # Red color
+CYAN = "\033[36m"   # Cyan color
+RESET = "\033[0m"
+
+_THINK_OPEN = "<think"
+_THINK_CLOSE = "</think>"
+_THINK_OPEN_RE = re.compile(re.escape(_THINK_OPEN), re.IGNORECASE)
+_THINK_CLOSE_RE = re.compile(re.escape(_THINK_CLOSE), re.IGNORECASE)
+
+
+def _partial_tag_length(text: str, tag: str) -> int:
+    """Return the length of the longest suffix of text that starts tag.
+
+    Args:
+        text: Text to inspect.
+        tag: Lower-case tag that may be split across streamed pieces.
+
+    Returns:
+        Number of trailing characters that must be held back.
+    """
+    for size in range(min(len(tag) - 1, len(text)), 0, -1):
+        if tag.startswith(text[-size:].lower()):
+            return size
+    return 0
+
+
+def _stdout_supports_color() -> bool:
+    """Return whether ANSI colors should be written to stdout.
+
+    Colors are skipped when stdout is not a terminal (e.g. redirected to a
+    file or pipe) or when the NO_COLOR environment variable is set.
+    """
+    if os.environ.get("NO_COLOR"):
+        return False
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
+class _ThinkStripper:
+    """Remove <think>...</think> spans from a response while it streams.
+
+    Tags may be split across streamed pieces, so a short tail that could
+    start a tag is held back until the next piece arrives. Text inside a
+    think block is dropped as soon as the block is closed; an unterminated
+    block is returned verbatim by flush(), as a regex pass would leave it.
+
+    Attributes:
+        in_think (bool): Whether the stream is currently inside a think block.
+        word_count (int): Whitespace-separated words seen in the raw input,
+            used for token estimation.
+    """
+
+    def __init__(self) -> None:
+        self.in_think = False
+        self.word_count = 0
+        self._ends_in_word = False
+        self._pending = ""
+        self._think_parts: List[str] = []
+
+    def _count_words(self, piece: str) -> None:
+        """Update word_count as if all pieces were joined and split()."""
+        words = len(piece.split())
+        if words and self._ends_in_word and not piece[0].isspace():
+            words -= 1
+        self.word_count += words
+        self._ends_in_word = not piece[-1].isspace()
+
+    def feed(self, piece: str) -> str:
+        """Consume a streamed piece and return its visible text.
+
+        Args:
+            piece: The next piece of the model's response.
+
+        Returns:
+            The part of the response that is safe to emit so far.
+        """
+        if not piece:
+            return ""
+        self._count_words(piece)
+        text = self._pending + piece
+        self._pending = ""
+        if "<" not in text:
+            # Fast path: no tag can start or end in this piece
+            if self.in_think:
+                self._think_parts.append(text)
+                return ""
+            return text
+        visible = []
+        while text:
+            if not self.in_think:
+                match = _THINK_OPEN_RE.search(text)
+                if match is None:
+                    keep = _partial_tag_length(text, _THINK_OPEN)
+                    visible.append(text[:len(text) - keep])
+                    self._pending = text[len(text) - keep:]
+                    break
+                start, name_end = match.span()
+                if name_end < len(text) and (
+                        text[name_end].isalnum() or text[name_end] == "_"):
+                    # Some other tag, e.g. <thinking>; keep it as text
+                    visible.append(text[:name_end])
+                    text = text[name_end:]
+                    continue
+                end = text.find(">", name_end)
+                if end == -1:
+                    visible.append(text[:start])
+                    self._pending = text[start:]
+                    break
+                visible.append(text[:start])
+                self._think_parts = [text[start:end + 1]]
+                self.in_think = True
+                text = text[end + 1:]
+            else:
+                match = _THINK_CLOSE_RE.search(text)
+                if match is None:
+                    keep = _partial_tag_length(text, _THINK_CLOSE)
+                    self._think_parts.append(text[:len(text) - keep])
+                    self._pending = text[len(text) - keep:]
+                    break
+                self._think_parts = []
+                self.in_think = False
+                text = text[match.end():]
+        return "".join(visible)
+
+    def flush(self) -> str:
+        """Return any text still held back once the response has ended."""
+        remainder = "".join(self._think_parts) + self._pending
+        self._think_parts = []
+        self._pending = ""
+        self.in_think = False
+        return remainder
+
+
+class _StreamEcho:
+    """Echo streamed pieces to stdout for debugging.
+
+    Pieces are encoded and written straight to the binary stdout buffer,
+    bypassing the text layer. Color escape codes are only written when the
+    color changes (and never when use_color is False), and output is flushed
+    on newlines or at most every FLUSH_INTERVAL seconds instead of once per
+    piece.
+    """
+
+    FLUSH_INTERVAL = 0.016
+
+    def __init__(self, use_color: bool = True) -> None:
+        stdout = sys.stdout
+        # Keep ordering with text already written through the text layer
+        stdout.flush()
+        buffer = getattr(stdout, "buffer", None)
+        if buffer is not None:
+            encoding = stdout.encoding or "utf-8"
+            self._write = lambda text: buffer.write(
+                text.encode(encoding, "replace")
+            )
+            self._flush = buffer.flush
+        else:
+            # e.g. stdout replaced by a StringIO
+            self._write = stdout.write
+            self._flush = stdout.flush
+        self._use_color = use_color
+        self._color = None
+        self._last_flush = time.monotonic()
+
+    def write(self, piece: str, color: str = GRAY) -> None:
+        """Write a streamed piece in the given color.
+
+        Args:
+            piece: The piece of the response to echo.
+            color: ANSI color code to display the piece with.
+        """
+        if self._use_color and color != self._color:
+            self._write(color)
+            self._color = color
+        self._write(piece)
+        now = time.monotonic()
+        if "\n" in piece or now - self._last_flush > self.FLUSH_INTERVAL:
+            self._flush()
+            self._last_flush = now
+
+    def close(self) -> None:
+        """Reset the terminal color and flush any pending output."""
+        if self._color is not None:
+            self._write(RESET)
+            self._color = None
+        self._flush()
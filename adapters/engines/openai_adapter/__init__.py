@@ -12,45 +12,116 @@ The engine supports:
 - Token usage tracking
 """
 
+import asyncio
 import os
+import random
 import re
 import logging
+import string
+import threading
 import time
-from typing import Dict, List, Tuple, Optional, Callable
-from openai import OpenAI
+from functools import cached_property, lru_cache, partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Tuple, Optional, Callable
 from alive_progress import alive_bar
-import tiktoken
+from core.domain.entities import Chapter
 from core.ports import CompletionEnginePort
-
-# ANSI color codes
-GRAY = "\033[90m"
-ORANGE = "\033[33m"  # Orange color
-RED = "\033[31m"    # Red color
-CYAN = "\033[36m"   # Cyan color
-RESET = "\033[0m"
+from adapters.engines.concurrency import iter_concurrently
+from adapters.engines.openai_adapter.batch import _run_chat_batch
+# OpenAIPromptError is re-exported so callers can catch every engine error
+# from the package itself
+from adapters.engines.openai_adapter.errors import (
+    OpenAIEngineError, OpenAIPromptError, OpenAIResponseError
+)
+from adapters.engines.openai_adapter.prompts import (
+    _PromptTemplate, _read_prompt_template, _resolve_prompt_path
+)
+from adapters.engines.openai_adapter.stream import (
+    GRAY, ORANGE, RESET, _StreamEcho
+)
+
+# openai and tiktoken take hundreds of milliseconds to import, so they are
+# only imported once an engine actually needs them
+if TYPE_CHECKING:
+    import tiktoken
+    from openai import AsyncOpenAI, OpenAI
 
 # OpenAI specific constants
 MODEL = "gpt-4"
 TEMPERATURE = 0.7
 MAX_TOKENS = 4096
 MAX_ITERATIONS = 3
+MAX_RETRIES = 3
+RETRY_DELAY = 2  # seconds, doubled after each failed attempt
+MAX_RETRY_DELAY = 60  # seconds
+DEFAULT_CONCURRENCY = 8
 INPUT_COST_PER_1K = 0.01   # Set your own price
 OUTPUT_COST_PER_1K = 0.03  # Set your own price
 
+# Precompiled patterns used to parse model responses
+_TITLE_BLOCK_RE = re.compile(
+    r"<TITLE_BLOCK>(.*?)</TITLE_BLOCK>", re.DOTALL | re.IGNORECASE
+)
+_TITLE_OVERVIEW_RE = re.compile(
+    r"<TITLE_OVERVIEW>(.*?)</TITLE_OVERVIEW>", re.DOTALL | re.IGNORECASE
+)
+# Matches lines like: 1. Decorators for Advanced Functionality | Decorators
+_TITLE_LINE_RE = re.compile(
+    r"^[^\S\n]*(.*?)[^\S\n]*\|[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE
+)
 
-class OpenAIEngineError(Exception):
-    """Base exception for OpenAI engine errors."""
+logger = logging.getLogger(__name__)
 
 
-class OpenAIPromptError(OpenAIEngineError):
-    """Raised when there are issues with prompt processing."""
+def _retry_delay(attempt: int, exc: Exception) -> float:
+    """Return how long to wait before retrying a failed request.
 
+    Rate-limit responses are retried after their Retry-After delay when the
+    server sends one. Other failures back off exponentially from RETRY_DELAY,
+    with jitter so that concurrent chapter requests don't retry in lockstep.
 
-class OpenAIResponseError(OpenAIEngineError):
-    """Raised when there are issues with the model's response."""
+    Args:
+        attempt: The zero-based number of the attempt that failed.
+        exc: The error raised by that attempt.
 
+    Returns:
+        The delay in seconds.
+    """
+    from openai import RateLimitError  # pylint: disable=import-outside-toplevel
 
-logger = logging.getLogger(__name__)
+    if isinstance(exc, RateLimitError):
+        try:
+            return min(MAX_RETRY_DELAY, float(exc.response.headers["retry-after"]))
+        except (KeyError, ValueError):
+            pass  # Missing, or an HTTP date rather than seconds
+    delay = min(MAX_RETRY_DELAY, RETRY_DELAY * 2 ** attempt)
+    return delay * random.uniform(0.5, 1.5)
+
+
+@lru_cache(maxsize=16)
+def _get_encoding(model: str) -> "tiktoken.Encoding":
+    """Return the tiktoken encoding for a model.
+
+    Loading an encoding parses its BPE merge table, which is slow, so the
+    result is cached per model and shared by all engine instances.
+
+    Args:
+        model: The OpenAI model name.
+
+    Returns:
+        The model's encoding, or cl100k_base if the model is unknown.
+    """
+    import tiktoken  # pylint: disable=import-outside-toplevel
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        logger.warning(
+            "Could not find specific tokenizer for model %s, "
+            "falling back to cl100k_base encoding",
+            model
+        )
+        return tiktoken.get_encoding("cl100k_base")
 
 
 class OpenAIEngine(CompletionEnginePort):
@@ -86,6 +157,11 @@ class OpenAIEngine(CompletionEnginePort):
         )
     }
 
+    # Sync clients shared by all engines, keyed by API key, so that their
+    # connection pools are reused across engine instances
+    _clients: Dict[Optional[str], "OpenAI"] = {}
+    _clients_lock = threading.Lock()
+
     def __init__(
         self,
         model: str = MODEL,
@@ -95,7 +171,9 @@ class OpenAIEngine(CompletionEnginePort):
         category: str = "Tip",
         expertise_level: str = "Novice",
         debug: bool = False,
-        progress_bar: bool = False
+        progress_bar: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        batch: bool = False
     ) -> None:
         """Initialize the OpenAI engine.
 
@@ -108,6 +186,8 @@ class OpenAIEngine(CompletionEnginePort):
             expertise_level: The expertise level for the content
             debug: Whether to show debug output
             progress_bar: Whether to show progress bar
+            concurrency: Maximum number of chapters generated at once
+            batch: Whether to submit chapter content through the Batch API
         """
         self.model = model
         self.temperature = temperature
@@ -129,93 +209,86 @@ class OpenAIEngine(CompletionEnginePort):
         self.debug = debug
         self.tokens_used = {"input": 0, "output": 0}
         self.quantity = 5  # Default quantity
+        self.concurrency = max(1, concurrency)
+        self.batch = batch
         self.progress_callback: Optional[Callable[[int, str], None]] = None
         try:
-            self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-            # Initialize tokenizer only if streaming is enabled
-            if self.stream:
-                try:
-                    self.encoding = tiktoken.encoding_for_model(model)
-                except KeyError:
-                    logger.warning(
-                        "Could not find specific tokenizer for model %s, "
-                        "falling back to cl100k_base encoding",
-                        model
-                    )
-                    self.encoding = tiktoken.get_encoding("cl100k_base")
+            self.client = self._get_client(os.getenv("OPENAI_API_KEY"))
         except Exception as exc:
             raise OpenAIEngineError(
                 f"Failed to initialize OpenAI client. "
                 f"Error: {str(exc)}"
             ) from exc
 
-        here = os.path.dirname(__file__)
-        # Load prompt templates based on model
-        base_model = self.model.split(":")[0].split(".")[0].lower()
+        # Prompt templates are read lazily, on first use
+        self._base_model = (
+            self.model.partition(":")[0].partition(".")[0].lower()
+        )
         # Determine prompt directory based on category
         prompt_subdir = "course" if self.category.lower() == "course" else "common"
-        # Load titles prompt template
-        titles_prompt_dir = os.path.abspath(
-            os.path.join(here, f"prompts/{prompt_subdir}/titles")
-        )
-        titles_prompt_path = os.path.join(
-            titles_prompt_dir, f"{base_model}.txt"
-        )
-        if not os.path.exists(titles_prompt_path):
-            titles_prompt_path = os.path.join(
-                titles_prompt_dir, "openai.txt"
-            )
-            logger.warning(
-                "Model-specific prompt template not found for %s, "
-                "falling back to openai.txt",
-                base_model
-            )
+        self._prompt_dir = Path(__file__).parent / "prompts" / prompt_subdir
 
-        logger.debug(
-            "%sUsing titles prompt file: %s%s",
-            CYAN,
-            titles_prompt_path,
-            RESET
-        )
-        try:
-            with open(titles_prompt_path, encoding="utf-8") as file:
-                self._prompt_titles_template = file.read()
-        except Exception as exc:
-            raise OpenAIPromptError(
-                f"Failed to load titles prompt template from "
-                f"{titles_prompt_path}. Error: {str(exc)}"
-            ) from exc
+    @classmethod
+    def _get_client(cls, api_key: Optional[str]) -> "OpenAI":
+        """Return the shared OpenAI client for an API key, creating it if needed.
 
-        # Load content prompt template
-        content_prompt_dir = os.path.abspath(
-            os.path.join(here, f"prompts/{prompt_subdir}/content")
-        )
-        content_prompt_path = os.path.join(
-            content_prompt_dir, f"{base_model}.txt"
+        Args:
+            api_key: The OpenAI API key.
+
+        Returns:
+            The client used by every engine with that API key.
+        """
+        client = cls._clients.get(api_key)
+        if client is None:
+            with cls._clients_lock:
+                client = cls._clients.get(api_key)
+                if client is None:
+                    from openai import OpenAI  # pylint: disable=import-outside-toplevel
+
+                    client = OpenAI(api_key=api_key)
+                    cls._clients[api_key] = client
+        return client
+
+    @cached_property
+    def _prompt_titles_template(self) -> str:
+        """The raw titles prompt template."""
+        return _read_prompt_template(
+            _resolve_prompt_path(self._prompt_dir, self._base_model, "titles")
         )
-        if not os.path.exists(content_prompt_path):
-            content_prompt_path = os.path.join(
-                content_prompt_dir, "openai.txt"
-            )
-            logger.warning(
-                "Model-specific content template not found for %s, "
-                "falling back to openai.txt",
-                base_model
-            )
 
-        logger.debug(
-            "%sUsing content prompt file: %s%s",
-            CYAN,
-            content_prompt_path,
-            RESET
+    @cached_property
+    def prompt_detail_template(self) -> str:
+        """The raw content prompt template."""
+        return _read_prompt_template(
+            _resolve_prompt_path(self._prompt_dir, self._base_model, "content")
         )
+
+    @cached_property
+    def _titles_template(self) -> _PromptTemplate:
+        """The parsed titles prompt template."""
+        return _PromptTemplate(self._prompt_titles_template)
+
+    @cached_property
+    def _detail_template(self) -> _PromptTemplate:
+        """The parsed content prompt template."""
+        return _PromptTemplate(self.prompt_detail_template)
+
+    @cached_property
+    def encoding(self) -> "tiktoken.Encoding":
+        """The tokenizer for this engine's model.
+
+        Only loaded when the API response carries no token usage and the
+        tokens have to be counted locally.
+
+        Raises:
+            OpenAIEngineError: If the tokenizer cannot be loaded.
+        """
         try:
-            with open(content_prompt_path, encoding="utf-8") as file:
-                self.prompt_detail_template = file.read()
+            return _get_encoding(self.model)
         except Exception as exc:
-            raise OpenAIPromptError(
-                f"Failed to load content prompt template from "
-                f"{content_prompt_path}. Error: {str(exc)}"
+            raise OpenAIEngineError(
+                f"Failed to load tokenizer for model {self.model}. "
+                f"Error: {str(exc)}"
             ) from exc
 
     def count_tokens(self, text: str) -> int:
@@ -231,6 +304,56 @@ class OpenAIEngine(CompletionEnginePort):
             return 0  # Don't count tokens manually when not streaming
         return len(self.encoding.encode(text))
 
+    def _record_usage(
+        self, usage, messages: List[Dict[str, str]], content: str
+    ) -> None:
+        """Add the token usage of one request to self.tokens_used.
+
+        The counts reported by the API are used when present; otherwise the
+        prompt and the completion are each counted once with tiktoken.
+
+        Args:
+            usage: The response's usage object, or None if it had none.
+            messages: The messages that were sent.
+            content: The full generated text.
+        """
+        if usage:
+            self.tokens_used["input"] += usage.prompt_tokens
+            self.tokens_used["output"] += usage.completion_tokens
+            return
+        for message in messages:
+            self.tokens_used["input"] += self.count_tokens(message["content"])
+        self.tokens_used["output"] += self.count_tokens(content)
+
+    def _consume_stream(self, response) -> Tuple[str, Any]:
+        """Collect a streamed response, echoing it when debugging.
+
+        Args:
+            response: The stream returned by chat.completions.create().
+
+        Returns:
+            A tuple of the full generated text and the usage carried by the
+            final chunk (None if the endpoint sent none).
+        """
+        pieces = []
+        usage = None
+        echo = _StreamEcho() if self.debug else None
+        try:
+            for chunk in response:
+                if chunk.usage:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                piece = chunk.choices[0].delta.content
+                if piece:
+                    pieces.append(piece)
+                    if echo:
+                        echo.write(piece)
+        finally:
+            if echo:
+                echo.close()
+        return "".join(pieces), usage
+
     def build_titles_prompt(self, topic: str) -> str:
         """Build the prompt for generating chapter titles.
 
@@ -240,13 +363,13 @@ class OpenAIEngine(CompletionEnginePort):
         Returns:
             The formatted prompt string.
         """
-        prompt = self._prompt_titles_template
-        prompt = prompt.replace("{{TOPIC}}", topic)
-        prompt = prompt.replace("{{QUANTITY}}", str(self.quantity))
-        prompt = prompt.replace("{{CATEGORY}}", self.category)
-        prompt = prompt.replace("{{EXPERTISE_LEVEL}}", self.expertise_level)
-        prompt = prompt.replace("{{CONTEXT_NOTE}}", self.context_note)
-        return prompt
+        return self._titles_template.safe_substitute(
+            TOPIC=topic,
+            QUANTITY=self.quantity,
+            CATEGORY=self.category,
+            EXPERTISE_LEVEL=self.expertise_level,
+            CONTEXT_NOTE=self.context_note
+        )
 
     def build_detail_prompt(
         self, topic: str, chapter_title: str, chapter_index: int,
@@ -263,16 +386,16 @@ class OpenAIEngine(CompletionEnginePort):
         Returns:
             The formatted prompt string.
         """
-        prompt = self.prompt_detail_template
-        prompt = prompt.replace("{{TOPIC}}", topic)
-        prompt = prompt.replace("{{CHAPTER_TITLE}}", chapter_title)
-        prompt = prompt.replace("{{CHAPTER_SHORT_TITLE}}", chapter_short_title)
-        prompt = prompt.replace("{{CATEGORY}}", self.category)
-        prompt = prompt.replace("{{EXPERTISE_LEVEL}}", self.expertise_level)
-        prompt = prompt.replace("{{CONTEXT_NOTE}}", self.context_note)
-        prompt = prompt.replace("{{CHAPTER_INDEX}}", str(chapter_index))
-        prompt = prompt.replace("{{QUANTITY}}", str(self.quantity))
-        return prompt
+        return self._detail_template.safe_substitute(
+            TOPIC=topic,
+            CHAPTER_TITLE=chapter_title,
+            CHAPTER_SHORT_TITLE=chapter_short_title,
+            CATEGORY=self.category,
+            EXPERTISE_LEVEL=self.expertise_level,
+            CONTEXT_NOTE=self.context_note,
+            CHAPTER_INDEX=chapter_index,
+            QUANTITY=self.quantity
+        )
 
     def generate_chapters(
         self, topic: str
@@ -308,39 +431,33 @@ class OpenAIEngine(CompletionEnginePort):
             {"role": "user", "content": prompt}
         ]
 
-        # Count input tokens only if streaming
-        if self.stream:
-            for message in messages:
-                self.tokens_used["input"] += self.count_tokens(message["content"])
-
         content = ""
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                stream=self.stream
-            )
-
             if self.stream:
-                for chunk in response:
-                    if hasattr(chunk.choices[0].delta, "content"):
-                        piece = chunk.choices[0].delta.content
-                        if piece:
-                            if self.debug:
-                                print(f"{GRAY}{piece}{RESET}", end="", flush=True)
-                            content += piece
-                            # Count output tokens in streaming mode
-                            self.tokens_used["output"] += self.count_tokens(piece)
+                # Ask for a final chunk carrying the token usage
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    stream=True,
+                    stream_options={"include_usage": True}
+                )
+                content, usage = self._consume_stream(response)
+                self._record_usage(usage, messages, content)
             else:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens
+                )
                 content = response.choices[0].message.content
                 if self.debug:
                     print(f"{GRAY}{content}{RESET}", end="", flush=True)
-                # Use native token counts when not streaming
-                if hasattr(response, "usage"):
-                    self.tokens_used["input"] += response.usage.prompt_tokens
-                    self.tokens_used["output"] += response.usage.completion_tokens
+                self._record_usage(
+                    getattr(response, "usage", None), messages, content
+                )
             if self.debug:
                 print("\n", end="", flush=True)
 
@@ -350,16 +467,8 @@ class OpenAIEngine(CompletionEnginePort):
             ) from e
 
         # Extract title block and overview using regex
-        title_block_match = re.search(
-            r"<TITLE_BLOCK>(.*?)</TITLE_BLOCK>",
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
-        overview_match = re.search(
-            r"<TITLE_OVERVIEW>(.*?)</TITLE_OVERVIEW>",
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
+        title_block_match = _TITLE_BLOCK_RE.search(content)
+        overview_match = _TITLE_OVERVIEW_RE.search(content)
 
         logger.debug("Content after all regex and tag fixes:\n%s", content)
         chapters = []
@@ -371,18 +480,10 @@ class OpenAIEngine(CompletionEnginePort):
                 "with a different topic or model."
             )
 
-        title_lines = title_block_match.group(1).strip().splitlines()
-        for line in title_lines:
-            # Match lines like: 1. Decorators for Advanced Functionality |
-            # Decorators
-            match = re.match(r"\s*(.*?)\s*\|\s*(.*)", line)
-            if match:
-                full_title = match.group(1).strip()
-                short_title = match.group(2).strip()
-                # If short title is empty, use the full title
-                if not short_title:
-                    short_title = full_title
-                chapters.append({"full": full_title, "short": short_title})
+        for match in _TITLE_LINE_RE.finditer(title_block_match.group(1)):
+            full_title, short_title = match.groups()
+            # If short title is empty, use the full title
+            chapters.append({"full": full_title, "short": short_title or full_title})
 
         if not chapters:
             raise OpenAIResponseError(
@@ -429,8 +530,8 @@ class OpenAIEngine(CompletionEnginePort):
             prompt,
             RESET
         )
-        max_retries = 3
-        retry_delay = 2  # seconds
+        messages = [{"role": "user", "content": prompt}]
+        max_retries = MAX_RETRIES
 
         logger.debug("Processing Chapter #%d of %d (Attempt 1)",
                     chapter_index, total_chapters)
@@ -440,21 +541,14 @@ class OpenAIEngine(CompletionEnginePort):
                 if self.stream:
                     response = self.client.chat.completions.create(
                         model=self.model,
-                        messages=[{"role": "user", "content": prompt}],
+                        messages=messages,
                         temperature=self.temperature,
                         max_tokens=self.max_tokens,
-                        stream=True
+                        stream=True,
+                        stream_options={"include_usage": True}
                     )
-                    collected_chunks = []
                     try:
-                        for chunk in response:
-                            if chunk.choices[0].delta.content is not None:
-                                piece = chunk.choices[0].delta.content
-                                if self.debug:
-                                    print(f"{GRAY}{piece}{RESET}", end="", flush=True)
-                                collected_chunks.append(piece)
-                                # Count tokens for streaming response
-                                self.tokens_used["output"] += self.count_tokens(piece)
+                        content, usage = self._consume_stream(response)
                     except Exception as stream_error:
                         if attempt < max_retries - 1:
                             logger.warning(
@@ -462,26 +556,30 @@ class OpenAIEngine(CompletionEnginePort):
                                 attempt + 1,
                                 max_retries
                             )
-                            time.sleep(retry_delay)
+                            time.sleep(_retry_delay(attempt, stream_error))
                             continue
                         raise OpenAIResponseError(
                             f"Failed to stream response. Error: {str(stream_error)}"
                         ) from stream_error
                     if self.debug:
                         print("\n[End of OpenAI Streaming Output]")
-                    return "".join(collected_chunks)
-                else:
-                    response = self.client.chat.completions.create(
-                        model=self.model,
-                        messages=[{"role": "user", "content": prompt}],
-                        temperature=self.temperature,
-                        max_tokens=self.max_tokens
-                    )
-                    content = response.choices[0].message.content
-                    if self.debug:
-                        print(f"{GRAY}{content}{RESET}")
+                    self._record_usage(usage, messages, content)
                     return content
 
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens
+                )
+                content = response.choices[0].message.content
+                if self.debug:
+                    print(f"{GRAY}{content}{RESET}")
+                self._record_usage(
+                    getattr(response, "usage", None), messages, content
+                )
+                return content
+
             except Exception as exc:
                 if attempt < max_retries - 1:
                     logger.warning(
@@ -489,7 +587,7 @@ class OpenAIEngine(CompletionEnginePort):
                         attempt + 1,
                         max_retries
                     )
-                    time.sleep(retry_delay)
+                    time.sleep(_retry_delay(attempt, exc))
                     continue
                 raise OpenAIResponseError(
                     f"Failed to generate chapter content. Error: {str(exc)}"
@@ -499,6 +597,270 @@ class OpenAIEngine(CompletionEnginePort):
             f"Failed to generate chapter content after {max_retries} attempts."
         )
 
+    async def _agenerate_content(
+        self, client: "AsyncOpenAI", topic: str, chapter_title: str,
+        chapter_index: int, total_chapters: int, chapter_short_title: str
+    ) -> str:
+        """Asynchronously generate detailed content for a chapter.
+
+        This mirrors generate_content() but runs on an AsyncOpenAI client so
+        that several chapters can be generated concurrently. Since the output
+        of concurrent chapters would interleave, the response is requested in
+        one piece and debug output is printed once it completes.
+
+        Args:
+            client: The async OpenAI client to use.
+            topic: The main topic.
+            chapter_title: The title of the chapter.
+            chapter_index: The index of the chapter.
+            total_chapters: Total number of chapters.
+            chapter_short_title: The short version of the chapter title.
+
+        Returns:
+            The generated content as a string.
+
+        Raises:
+            OpenAIResponseError: If there's an error generating content.
+        """
+        prompt = self.build_detail_prompt(
+            topic, chapter_title, chapter_index, chapter_short_title
+        )
+        logger.debug(
+            "----Prompt BEGIN----\n"
+            "%s%s%s\n"
+            "----Prompt END----",
+            ORANGE,
+            prompt,
+            RESET
+        )
+        logger.debug("Processing Chapter #%d of %d (Attempt 1)",
+                    chapter_index, total_chapters)
+
+        messages = [{"role": "user", "content": prompt}]
+        for attempt in range(MAX_RETRIES):
+            try:
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens
+                )
+            except Exception as exc:
+                if attempt < MAX_RETRIES - 1:
+                    logger.warning(
+                        "Error occurred, retrying... (Attempt %d/%d)",
+                        attempt + 1,
+                        MAX_RETRIES
+                    )
+                    await asyncio.sleep(_retry_delay(attempt, exc))
+                    continue
+                raise OpenAIResponseError(
+                    f"Failed to generate chapter content. Error: {str(exc)}"
+                ) from exc
+
+            content = response.choices[0].message.content
+            if self.debug:
+                print(f"{GRAY}{content}{RESET}", flush=True)
+            self._record_usage(
+                getattr(response, "usage", None), messages, content
+            )
+            return content
+
+        raise OpenAIResponseError(
+            f"Failed to generate chapter content after {MAX_RETRIES} attempts."
+        )
+
+    def _iter_batch_details(
+        self,
+        topic: str,
+        chapters: List[Dict[str, str]],
+        progress: Optional[Callable] = None
+    ) -> Iterator[Chapter]:
+        """Generate the content of all chapters through the OpenAI Batch API.
+
+        All chapter requests are submitted as one batch, which is billed at
+        a discount but may take up to a day to finish. Chapters the batch
+        did not answer successfully are then generated with regular
+        requests, concurrently when ``self.concurrency`` allows it.
+
+        Args:
+            topic: The topic to generate content for.
+            chapters: The chapters returned by generate_chapters().
+            progress: Optional alive_bar handle to advance per chapter.
+
+        Yields:
+            The chapters answered by the batch, in chapter order, followed
+            by any regenerated chapters as they complete.
+
+        Raises:
+            OpenAIResponseError: If the batch cannot be submitted or fails.
+        """
+        total_chapters = len(chapters)
+        requests = {}
+        for i, chapter in enumerate(chapters, 1):
+            prompt = self.build_detail_prompt(
+                topic, chapter["full"], i, chapter["short"]
+            )
+            requests[f"chapter-{i}"] = {
+                "model": self.model,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": self.temperature,
+                "max_tokens": self.max_tokens
+            }
+
+        def on_poll(batch) -> None:
+            if progress:
+                progress.text(
+                    f"Batch {batch.status}: "
+                    f"{batch.request_counts.completed}/{total_chapters}"
+                    if batch.request_counts else f"Batch {batch.status}"
+                )
+
+        try:
+            results = _run_chat_batch(self.client, requests, on_poll)
+        except Exception as exc:
+            raise OpenAIResponseError(
+                f"Failed to run chapter content batch. Error: {str(exc)}"
+            ) from exc
+
+        missing = {}
+        for i, chapter in enumerate(chapters, 1):
+            body = results.get(f"chapter-{i}")
+            if body is None:
+                missing[i] = chapter
+                continue
+            detail = body["choices"][0]["message"]["content"]
+            usage = body.get("usage")
+            if usage:
+                self.tokens_used["input"] += usage["prompt_tokens"]
+                self.tokens_used["output"] += usage["completion_tokens"]
+            if self.debug:
+                print(f"{GRAY}{detail}{RESET}", flush=True)
+            if progress:
+                progress()
+            yield Chapter(chapter["full"], chapter["short"], detail, i)
+
+        if missing:
+            logger.warning(
+                "Batch returned no content for chapters %s, "
+                "generating them directly",
+                ", ".join(f"#{i}" for i in missing)
+            )
+            yield from self._iter_direct_details(
+                topic, missing, total_chapters, progress
+            )
+
+    def iter_details(
+        self,
+        topic: str,
+        chapters: List[Dict[str, str]],
+        progress: Optional[Callable] = None
+    ) -> Iterator[Chapter]:
+        """Generate the content of all chapters, yielding each as it is done.
+
+        With ``self.batch`` set, all chapters are submitted as one Batch API
+        job. Otherwise chapters are generated concurrently when
+        ``self.concurrency`` allows it, in which case they are yielded in
+        completion order, or one after another (with live streamed output).
+        At most ``self.concurrency`` requests are in flight at once, to stay
+        within the account's rate limits. This also works when called from
+        code that is already running an event loop.
+
+        Args:
+            topic: The topic to generate content for.
+            chapters: The chapters returned by generate_chapters().
+            progress: Optional alive_bar handle to advance per chapter.
+
+        Yields:
+            Each generated chapter as soon as it completes.
+        """
+        if self.batch:
+            yield from self._iter_batch_details(topic, chapters, progress)
+        else:
+            yield from self._iter_direct_details(
+                topic, dict(enumerate(chapters, 1)), len(chapters), progress
+            )
+
+    def _iter_direct_details(
+        self,
+        topic: str,
+        chapters: Dict[int, Dict[str, str]],
+        total_chapters: int,
+        progress: Optional[Callable] = None
+    ) -> Iterator[Chapter]:
+        """Generate chapters with regular requests, yielding each when done.
+
+        Args:
+            topic: The topic to generate content for.
+            chapters: The chapters to generate, keyed by chapter index.
+            total_chapters: The number of chapters in the whole course.
+            progress: Optional alive_bar handle to advance per chapter.
+
+        Yields:
+            Each generated chapter as soon as it completes.
+        """
+        if self.concurrency <= 1 or len(chapters) <= 1:
+            for i, chapter in chapters.items():
+                if progress:
+                    progress.text(f"Processing: {chapter['short']}")
+                detail = self.generate_content(
+                    topic,
+                    chapter["full"],
+                    i,
+                    total_chapters,
+                    chapter["short"]
+                )
+                if progress:
+                    progress()
+                yield Chapter(chapter["full"], chapter["short"], detail, i)
+            return
+
+        from openai import AsyncOpenAI  # pylint: disable=import-outside-toplevel
+
+        client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+        async def worker(index: int, chapter: Dict[str, str]) -> Chapter:
+            if progress:
+                progress.text(f"Processing: {chapter['short']}")
+            detail = await self._agenerate_content(
+                client,
+                topic,
+                chapter["full"],
+                index,
+                total_chapters,
+                chapter["short"]
+            )
+            if progress:
+                progress()
+            return Chapter(chapter["full"], chapter["short"], detail, index)
+
+        yield from iter_concurrently(
+            (partial(worker, i, chapter) for i, chapter in chapters.items()),
+            self.concurrency,
+            client.close
+        )
+
+    def _generate_details(
+        self,
+        topic: str,
+        chapters: List[Dict[str, str]],
+        progress: Optional[Callable] = None
+    ) -> List[Chapter]:
+        """Generate the content of all chapters.
+
+        Args:
+            topic: The topic to generate content for.
+            chapters: The chapters returned by generate_chapters().
+            progress: Optional alive_bar handle to advance per chapter.
+
+        Returns:
+            The generated chapters in chapter order.
+        """
+        return sorted(
+            self.iter_details(topic, chapters, progress),
+            key=lambda chapter: chapter.index
+        )
+
     def calculate_costs(self) -> Dict[str, float]:
         """Calculate the total cost of API usage.
 
@@ -527,7 +889,7 @@ class OpenAIEngine(CompletionEnginePort):
     def generate(
         self,
         topic: str
-    ) -> Tuple[List[Tuple[int, Dict[str, str], str]], str]:
+    ) -> Tuple[List[Chapter], str]:
         """Generate a complete set of chapters with their content."""
         # Reset token usage at the start of generation
         self.tokens_used = {"input": 0, "output": 0}
@@ -537,39 +899,18 @@ class OpenAIEngine(CompletionEnginePort):
             print("Generating chapter titles...")
         chapters, overview = self.generate_chapters(topic)
 
-        details = []
-        total_chapters = len(chapters)
-
         # Generate content for each chapter
         if self.progress_bar:
             with alive_bar(
-                total_chapters,
+                len(chapters),
                 title="Generating content",
                 bar="smooth",
                 spinner="waves",
                 enrich_print=False
             ) as progress:
-                for i, chapter in enumerate(chapters, 1):
-                    progress.text(f"Processing: {chapter['short']}")
-                    detail = self.generate_content(
-                        topic,
-                        chapter["full"],
-                        i,
-                        total_chapters,
-                        chapter["short"]
-                    )
-                    details.append((i, chapter, detail))
-                    progress()   # pylint: disable=not-callable
+                details = self._generate_details(topic, chapters, progress)
         else:
-            for i, chapter in enumerate(chapters, 1):
-                detail = self.generate_content(
-                    topic,
-                    chapter["full"],
-                    i,
-                    total_chapters,
-                    chapter["short"]
-                )
-                details.append((i, chapter, detail))
+            details = self._generate_details(topic, chapters)
 
         # Calculate and log costs
         costs = self.calculate_costs()
@@ -0,0 +1,92 @@
+"""OpenAI Batch API helpers for the OpenAI engine.
+
+Submits chat completion requests as a single batch job, waits for it to
+finish and maps the results back to their requests.
+"""
+
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+BATCH_POLL_INTERVAL = 30  # seconds between Batch API status checks
+BATCH_COMPLETION_WINDOW = "24h"
+_CHAT_COMPLETIONS_URL = "/v1/chat/completions"
+_FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_batch_output(output: str) -> Dict[str, Dict[str, Any]]:
+    """Return the successful response bodies of a batch output file.
+
+    Args:
+        output: The JSONL text of the batch's output file.
+
+    Returns:
+        The chat completion bodies keyed by custom_id. Requests that failed
+        (a non-200 status, or an error instead of a response) are left out.
+    """
+    results = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        response = result.get("response") or {}
+        if response.get("status_code") == 200:
+            results[result["custom_id"]] = response["body"]
+    return results
+
+
+def _run_chat_batch(
+    client,
+    requests: Dict[str, Dict[str, Any]],
+    on_poll: Optional[Callable[[Any], None]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Run chat completion requests as one Batch API job.
+
+    The requests are uploaded as an in-memory JSONL file and the batch is
+    polled every BATCH_POLL_INTERVAL seconds until it finishes.
+
+    Args:
+        client: The sync OpenAI client.
+        requests: The chat completion request bodies, keyed by custom_id.
+        on_poll: Optional callback receiving the batch while it is running.
+
+    Returns:
+        The chat completion bodies of the requests that succeeded, keyed by
+        custom_id.
+
+    Raises:
+        RuntimeError: If the batch fails, expires or is cancelled.
+    """
+    batch_input = "".join(
+        json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": _CHAT_COMPLETIONS_URL,
+            "body": body
+        }) + "\n"
+        for custom_id, body in requests.items()
+    )
+    input_file = client.files.create(
+        file=("requests.jsonl", batch_input.encode("utf-8")),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=_CHAT_COMPLETIONS_URL,
+        completion_window=BATCH_COMPLETION_WINDOW
+    )
+    logger.info("Submitted batch %s with %d requests", batch.id, len(requests))
+    while batch.status not in _FINAL_STATUSES:
+        if on_poll:
+            on_poll(batch)
+        time.sleep(BATCH_POLL_INTERVAL)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+    if not batch.output_file_id:
+        return {}
+    return _parse_batch_output(client.files.content(batch.output_file_id).text)
@@ -0,0 +1,13 @@
+"""Exceptions raised by the OpenAI engine."""
+
+
+class OpenAIEngineError(Exception):
+    """Base exception for OpenAI engine errors."""
+
+
+class OpenAIPromptError(OpenAIEngineError):
+    """Raised when there are issues with prompt processing."""
+
+
+class OpenAIResponseError(OpenAIEngineError):
+    """Raised when there are issues with the model's response."""
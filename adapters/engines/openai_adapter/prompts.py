@@ -0,0 +1,89 @@
+"""Prompt template loading and rendering for the OpenAI engine."""
+
+import logging
+import string
+from functools import lru_cache
+from pathlib import Path
+
+from adapters.engines.openai_adapter.errors import OpenAIPromptError
+from adapters.engines.openai_adapter.stream import CYAN, RESET
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _resolve_prompt_path(prompt_dir: Path, base_model: str, kind: str) -> Path:
+    """Return the prompt template file of the given kind for a model.
+
+    Falls back to openai.txt when there is no model-specific template. The
+    result is cached per model and kind.
+
+    Args:
+        prompt_dir: The category prompt directory (e.g. prompts/common).
+        base_model: The model name without version suffix.
+        kind: The template kind, either "titles" or "content".
+
+    Returns:
+        The path of the template file to use.
+    """
+    kind_dir = prompt_dir / kind
+    prompt_path = kind_dir / f"{base_model}.txt"
+    if not prompt_path.is_file():
+        prompt_path = kind_dir / "openai.txt"
+        logger.warning(
+            "Model-specific %s template not found for %s, "
+            "falling back to openai.txt",
+            kind,
+            base_model
+        )
+
+    logger.debug(
+        "%sUsing %s prompt file: %s%s",
+        CYAN,
+        kind,
+        prompt_path,
+        RESET
+    )
+    return prompt_path
+
+
+@lru_cache(maxsize=32)
+def _read_prompt_template(prompt_path: Path) -> str:
+    """Read a prompt template file.
+
+    The result is cached by path, so engine instances sharing a template
+    share one copy of its text.
+
+    Args:
+        prompt_path: The template file to read.
+
+    Returns:
+        The raw template text.
+
+    Raises:
+        OpenAIPromptError: If the template cannot be read.
+    """
+    try:
+        return prompt_path.read_text(encoding="utf-8")
+    except Exception as exc:
+        raise OpenAIPromptError(
+            f"Failed to load prompt template from {prompt_path}. "
+            f"Error: {str(exc)}"
+        ) from exc
+
+
+class _PromptTemplate(string.Template):
+    """string.Template using the {{NAME}} placeholders of the prompt files.
+
+    All placeholders are rendered in a single pass; unknown ones are left
+    untouched by safe_substitute().
+    """
+    flags = 0
+    pattern = r"""
+    \{\{(?:
+        (?P<named>[_A-Z][_A-Z0-9]*)\}\} |
+        (?P<braced>(?!)) |
+        (?P<escaped>(?!)) |
+        (?P<invalid>(?!))
+    )
+    """
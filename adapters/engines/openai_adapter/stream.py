@@ -0,0 +1,51 @@
+"""Streaming helpers for the OpenAI engine.
+
+Echoes streamed response pieces to the terminal for debugging.
+"""
+
+import sys
+import time
+
+# ANSI color codes
+GRAY = "\033[90m"
+ORANGE = "\033[33m"  # Orange color
+RED = "\033[31m"    # Red color
+CYAN = "\033[36m"   # Cyan color
+RESET = "\033[0m"
+
+
+class _StreamEcho:
+    """Echo streamed pieces to stdout for debugging.
+
+    The color escape codes are written once around the whole stream rather
+    than around every piece, and output is flushed on newlines or at most
+    every FLUSH_INTERVAL seconds instead of once per piece.
+    """
+
+    FLUSH_INTERVAL = 0.016
+
+    def __init__(self) -> None:
+        self._started = False
+        self._last_flush = time.monotonic()
+
+    def write(self, piece: str) -> None:
+        """Write a streamed piece.
+
+        Args:
+            piece: The piece of the response to echo.
+        """
+        if not self._started:
+            sys.stdout.write(GRAY)
+            self._started = True
+        sys.stdout.write(piece)
+        now = time.monotonic()
+        if "\n" in piece or now - self._last_flush > self.FLUSH_INTERVAL:
+            sys.stdout.flush()
+            self._last_flush = now
+
+    def close(self) -> None:
+        """Reset the terminal color and flush any pending output."""
+        if self._started:
+            sys.stdout.write(RESET)
+            self._started = False
+        sys.stdout.flush()
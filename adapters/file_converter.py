@@ -9,11 +9,15 @@ Provides a concrete implementation of FileConverterPort for converting markdown
 to HTML, EPUB, and PDF using Pandoc and WeasyPrint.
 """
 
+import hashlib
+import json
 import os
+import shlex
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import subprocess
 import logging
-from typing import Optional
+from typing import List, Optional
 from core.ports import FileConverterPort
 
 logger = logging.getLogger(__name__)
@@ -75,6 +79,70 @@ class FileConverter(FileConverterPort):
 
         return str(css_path)
 
+    @staticmethod
+    def _run(cmd: List[str]) -> bool:
+        """Run a conversion command, logging its outcome.
+
+        Failures are logged rather than raised, so the remaining formats
+        are still produced.
+
+        Args:
+            cmd (List[str]): The command and its arguments.
+
+        Returns:
+            bool: Whether the command succeeded.
+        """
+        # Quoted so the logged command can be pasted back into a shell; only
+        # joined when a message is actually logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Running command: %s", shlex.join(cmd))
+        try:
+            subprocess.run(cmd, check=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Command succeeded: %s", shlex.join(cmd))
+            return True
+        except subprocess.CalledProcessError as exc:
+            logger.error("Command failed: %s | Error: %s", shlex.join(cmd), exc)
+            return False
+
+    def _source_digest(self, md_path: Path, metadata: dict) -> str:
+        """Hash everything the outputs of a conversion are built from.
+
+        Args:
+            md_path (Path): The markdown file being converted.
+            metadata (dict): The metadata embedded in the outputs.
+
+        Returns:
+            str: Hex digest of the markdown, the theme CSS and the metadata.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(md_path.read_bytes())
+        digest.update(Path(self.css_file).read_bytes())
+        digest.update(json.dumps(metadata, sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _is_up_to_date(output_file: str, digest: str) -> bool:
+        """Check whether an output was built from the given sources.
+
+        Each successfully built output gets a ``<output>.hash`` sidecar
+        holding the digest of its sources.
+
+        Args:
+            output_file (str): Path of the output file.
+            digest (str): Digest of the current sources.
+
+        Returns:
+            bool: Whether the output exists and its sidecar matches.
+        """
+        try:
+            return (
+                os.path.exists(output_file)
+                and Path(f"{output_file}.hash").read_text(encoding="utf-8") == digest
+            )
+        except OSError:
+            return False
+
     def convert(self, md_file: str, metadata: Optional[dict] = None, force: bool = False) -> None:
         """Convert a markdown file to HTML, EPUB, and PDF formats.
 
@@ -97,8 +165,20 @@ class FileConverter(FileConverterPort):
             'pdf': str(output_dir / f"{base_name}.pdf")
         }
 
+        # Outputs already built from identical sources are left alone,
+        # unless a rebuild is forced
+        digest = self._source_digest(md_path, metadata)
+        stale = set(output_files) if force else {
+            fmt for fmt, output_file in output_files.items()
+            if not self._is_up_to_date(output_file, digest)
+        }
+        if not stale:
+            logger.info("Outputs are up to date, skipping conversion of %s", md_file)
+            return
+
         # Check if output files exist and handle force flag
-        for output_file in output_files.values():
+        for fmt in stale:
+            output_file = output_files[fmt]
             if os.path.exists(output_file) and not force:
                 logger.error("Output file already exists: %s", output_file)
                 logger.error("Use --force to overwrite existing file")
@@ -109,24 +189,35 @@ class FileConverter(FileConverterPort):
         for key, value in metadata.items():
             meta_args.extend(["--metadata", f"{key}={value}"])
 
-        cmds = [
-            [
-                "pandoc", md_file, "-o", output_files['html'], "--standalone",
-                "--embed-resources", f"--css={self.css_file}",
-                "--highlight-style=kate"
-            ],
-            [
-                "pandoc", md_file, "-o", output_files['epub'], "--standalone",
-                "--embed-resources", f"--css={self.css_file}",
-                "--highlight-style=kate"
-            ] + meta_args,
-            ["weasyprint", output_files['html'], output_files['pdf']]
+        html_cmd = [
+            "pandoc", md_file, "-o", output_files['html'], "--standalone",
+            "--embed-resources", f"--css={self.css_file}",
+            "--highlight-style=kate"
         ]
-
-        for cmd in cmds:
-            logger.info("Running command: %s", ' '.join(cmd))
-            try:
-                subprocess.run(cmd, check=True)
-                logger.info("Command succeeded: %s", ' '.join(cmd))
-            except subprocess.CalledProcessError as exc:
-                logger.error("Command failed: %s | Error: %s", ' '.join(cmd), exc)
+        epub_cmd = [
+            "pandoc", md_file, "-o", output_files['epub'], "--standalone",
+            "--embed-resources", f"--css={self.css_file}",
+            "--highlight-style=kate"
+        ] + meta_args
+        pdf_cmd = ["weasyprint", output_files['html'], output_files['pdf']]
+
+        def build(fmt: str, cmd: List[str]) -> bool:
+            if fmt not in stale:
+                logger.info("Up to date, skipping: %s", output_files[fmt])
+                return True
+            if not self._run(cmd):
+                return False
+            Path(f"{output_files[fmt]}.hash").write_text(digest, encoding="utf-8")
+            return True
+
+        # The EPUB build is independent of the other two, so it runs in the
+        # background while the HTML is built and then rendered to PDF
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            epub_build = executor.submit(build, 'epub', epub_cmd)
+            # The PDF is rendered from the HTML, so it is only built from an
+            # HTML file that is current for these sources
+            if build('html', html_cmd):
+                build('pdf', pdf_cmd)
+            else:
+                logger.error("HTML build failed, skipping: %s", output_files['pdf'])
+            epub_build.result()
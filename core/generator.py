@@ -90,7 +90,7 @@ class AIKnowledgeGenerator:
 
         # Generate content
         self.engine.quantity = quantity
-        details, overview = self.engine.generate(topic)
+        chapters, overview = self.engine.generate(topic)
         tokens_used = (
             self.engine.tokens_used
             if hasattr(self.engine, "tokens_used")
@@ -104,8 +104,8 @@ class AIKnowledgeGenerator:
         content = ""
         if overview:
             content += overview + "\n"
-        for _, _, detail in details:
-            content += detail + "\n"
+        for chapter in chapters:
+            content += chapter.content + "\n"
         reading_time = self.calculate_reading_time(content)
 
         # Create header with metadata
@@ -126,8 +126,8 @@ class AIKnowledgeGenerator:
             file.write(header)
             if overview:
                 file.write(overview + "\n\n")
-            for _, _, detail in details:
-                file.write(detail.strip() + "\n\n")
+            for chapter in chapters:
+                file.write(chapter.content.strip() + "\n\n")
 
         # Convert to other formats
         metadata = {
@@ -6,7 +6,9 @@ Defines abstract base classes for completion engines and file converters.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Tuple, List, Dict
+from typing import Tuple, List
+
+from core.domain.entities import Chapter
 
 
 logger = logging.getLogger(__name__)
@@ -18,15 +20,15 @@ class CompletionEnginePort(ABC):
     def generate(
         self,
         topic: str
-    ) -> Tuple[List[Tuple[int, Dict[str, str], str]], str]:
+    ) -> Tuple[List[Chapter], str]:
         """Generate content for a given topic.
 
         Args:
             topic (str): The topic to generate content for.
 
         Returns:
-            Tuple[List[Tuple[int, Dict[str, str], str]], str]: A tuple containing:
-                - List of tuples with (index, chapter_info, content)
+            Tuple[List[Chapter], str]: A tuple containing:
+                - List of generated chapters, in chapter order
                 - Overview string of the generated chapters
         """
         # Abstract method, do not implement
@@ -69,8 +69,9 @@ More dummy content.
             file_path = base + ext
             results[ext] = os.path.exists(file_path)
 
-        # Cleanup
-        for ext in [".md", ".html", ".pdf", ".epub"]:
+        # Cleanup, including the build hash sidecars next to each output
+        for ext in [".md", ".html", ".pdf", ".epub",
+                    ".html.hash", ".pdf.hash", ".epub.hash"]:
             file_path = base + ext
             if os.path.exists(file_path):
                 os.remove(file_path)
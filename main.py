@@ -236,6 +236,10 @@ Monitoring:
     openai_group = parser.add_argument_group('OpenAI Arguments')
     openai_group.add_argument('--openai-model', default='gpt-4', help='OpenAI model to use (e.g., gpt-4, gpt-3.5-turbo)')
     openai_group.add_argument('--openai-stream', type=str2bool, default=True, help='Enable streaming for OpenAI responses (true/false, yes/no, 1/0)')
+    openai_group.add_argument('--openai-concurrency', type=int, default=8, metavar='N',
+        help='Maximum number of chapters generated concurrently (default: 8)')
+    openai_group.add_argument('--openai-batch', action='store_true',
+        help='Generate chapter content through the OpenAI Batch API (cheaper, but may take up to 24h)')
 
     # Ollama specific arguments
     ollama_group = parser.add_argument_group('Ollama Arguments')
@@ -245,6 +249,12 @@ Monitoring:
     ollama_group.add_argument('--ollama-think', type=str2bool, default=True, metavar='VALUE',
         help='Enable/disable thinking process in Ollama. If no value is provided, defaults to True. Accepted values: true/false, yes/no, 1/0, on/off',
         const=True, nargs='?')
+    ollama_group.add_argument('--ollama-concurrency', type=int, default=None, metavar='N',
+        help='Maximum number of chapters generated concurrently (default: $OLLAMA_PARALLEL or 4)')
+    ollama_group.add_argument('--ollama-cache-dir', default=None, metavar='DIR',
+        help='Cache model responses in DIR and reuse them for identical requests')
+    ollama_group.add_argument('--ollama-draft-model', default=None, metavar='MODEL',
+        help='Smaller Ollama model that drafts each chapter for the main model to review')
 
     args = parser.parse_args()
 
@@ -318,7 +328,9 @@ Monitoring:
             category=args.category,
             expertise_level=args.expertise_level,
             debug=args.debug,
-            progress_bar=args.progress_bar
+            progress_bar=args.progress_bar,
+            concurrency=args.openai_concurrency,
+            batch=args.openai_batch
         )
     else:  # ollama
         engine = OllamaEngine(
@@ -329,7 +341,10 @@ Monitoring:
             expertise_level=args.expertise_level,
             debug=args.debug,
             progress_bar=args.progress_bar,
-            think=args.ollama_think
+            think=args.ollama_think,
+            concurrency=args.ollama_concurrency,
+            cache_dir=args.ollama_cache_dir,
+            draft_model=args.ollama_draft_model
         )
     converter = FileConverter(theme=args.theme)
 
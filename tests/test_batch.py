@@ -0,0 +1,163 @@
+"""
+Test suite for the OpenAIEngine Batch API mode.
+
+This module runs the batch flow against a stubbed client and checks that
+results are mapped back to their chapters, that failed requests are
+dropped, and that unanswered chapters are regenerated concurrently.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from adapters.engines.openai_adapter import OpenAIEngine, OpenAIResponseError
+from adapters.engines.openai_adapter.batch import (
+    _parse_batch_output, _run_chat_batch
+)
+
+CHAPTERS = [
+    {"full": f"Chapter {i}", "short": f"C{i}"} for i in range(1, 5)
+]
+
+
+def success_line(custom_id, content):
+    """Return a batch output line for a successful request."""
+    return json.dumps({
+        "custom_id": custom_id,
+        "response": {
+            "status_code": 200,
+            "body": {
+                "choices": [{"message": {"content": content}}],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 20}
+            }
+        },
+        "error": None
+    })
+
+
+class StubBatchClient:  # pylint: disable=too-few-public-methods
+    """Minimal stand-in for the files and batches APIs of an OpenAI client."""
+
+    def __init__(self, statuses, answer):
+        self.statuses = list(statuses)
+        self.answer = answer
+        self.uploaded = []
+        self.files = SimpleNamespace(create=self._upload, content=self._content)
+        self.batches = SimpleNamespace(
+            create=lambda **kwargs: self._batch(), retrieve=lambda _id: self._batch()
+        )
+
+    def _upload(self, file, purpose):
+        assert purpose == "batch"
+        self.uploaded = [json.loads(line) for line in file[1].decode().splitlines()]
+        return SimpleNamespace(id="file-in")
+
+    def _batch(self):
+        status = self.statuses.pop(0)
+        return SimpleNamespace(
+            id="batch-1", status=status, output_file_id="file-out",
+            request_counts=None
+        )
+
+    def _content(self, file_id):
+        assert file_id == "file-out"
+        return SimpleNamespace(text=self.answer(self.uploaded))
+
+
+@pytest.fixture(autouse=True)
+def no_polling_delay(monkeypatch):
+    """Poll the stubbed batch without sleeping."""
+    monkeypatch.setattr("adapters.engines.openai_adapter.batch.time.sleep", lambda _: None)
+
+
+def test_parse_output_keeps_successful_results_only():
+    """Errored, non-200 and blank lines are left out; order does not matter."""
+    output = "\n".join([
+        success_line("chapter-3", "three"),
+        json.dumps({"custom_id": "chapter-2", "response": None,
+                    "error": {"code": "server_error"}}),
+        json.dumps({"custom_id": "chapter-4",
+                    "response": {"status_code": 500, "body": {}}}),
+        "",
+        success_line("chapter-1", "one"),
+    ])
+    results = _parse_batch_output(output)
+    assert sorted(results) == ["chapter-1", "chapter-3"]
+    assert results["chapter-3"]["choices"][0]["message"]["content"] == "three"
+
+
+def test_run_chat_batch_polls_until_completed():
+    """Requests are uploaded by custom_id and the batch polled to the end."""
+    client = StubBatchClient(
+        ["validating", "in_progress", "completed"],
+        lambda uploaded: "\n".join(
+            success_line(item["custom_id"], "ok") for item in uploaded
+        )
+    )
+    polled = []
+    results = _run_chat_batch(
+        client, {"a": {"model": "m"}, "b": {"model": "m"}}, polled.append
+    )
+    assert [item["custom_id"] for item in client.uploaded] == ["a", "b"]
+    assert client.uploaded[0]["url"] == "/v1/chat/completions"
+    assert sorted(results) == ["a", "b"]
+    assert [batch.status for batch in polled] == ["validating", "in_progress"]
+
+
+def test_run_chat_batch_raises_when_batch_fails():
+    """A batch that does not complete is reported as an error."""
+    client = StubBatchClient(["failed"], lambda uploaded: "")
+    with pytest.raises(RuntimeError, match="failed"):
+        _run_chat_batch(client, {"a": {}})
+
+
+@pytest.fixture(name="engine")
+def fixture_engine(monkeypatch):
+    """An OpenAIEngine in batch mode that must not stream any request."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    engine = OpenAIEngine(stream=False, batch=True, concurrency=4)
+
+    def no_sequential_call(*args):
+        raise AssertionError("fallback must not use the sequential path")
+
+    monkeypatch.setattr(engine, "generate_content", no_sequential_call)
+    return engine
+
+
+def test_batch_results_mapped_and_missing_chapters_regenerated(engine, monkeypatch):
+    """Answered chapters come from the batch; the rest go through the async path."""
+    engine.client = StubBatchClient(
+        ["in_progress", "completed"],
+        lambda uploaded: "\n".join(
+            # Answers arrive out of order, and chapters 2 and 4 fail
+            success_line(item["custom_id"], f"batch {item['custom_id']}")
+            for item in reversed(uploaded)
+            if item["custom_id"] in ("chapter-1", "chapter-3")
+        ) + "\n" + json.dumps({"custom_id": "chapter-2", "response": None,
+                               "error": {"code": "server_error"}})
+    )
+    regenerated = []
+
+    async def fake_agenerate(*args):
+        index, total, short = args[3:]
+        regenerated.append((index, total, short))
+        return f"direct {index}"
+
+    monkeypatch.setattr(engine, "_agenerate_content", fake_agenerate)
+    details = engine._generate_details("Python", CHAPTERS)  # pylint: disable=protected-access
+
+    assert [(d.index, d.title, d.content) for d in details] == [
+        (1, "Chapter 1", "batch chapter-1"),
+        (2, "Chapter 2", "direct 2"),
+        (3, "Chapter 3", "batch chapter-3"),
+        (4, "Chapter 4", "direct 4"),
+    ]
+    assert sorted(regenerated) == [(2, 4, "C2"), (4, 4, "C4")]
+    assert engine.tokens_used == {"input": 20, "output": 40}
+
+
+def test_failed_batch_raises_response_error(engine):
+    """A batch that ends without completing raises OpenAIResponseError."""
+    engine.client = StubBatchClient(["expired"], lambda uploaded: "")
+    with pytest.raises(OpenAIResponseError, match="expired"):
+        engine._generate_details("Python", CHAPTERS)  # pylint: disable=protected-access
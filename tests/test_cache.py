@@ -0,0 +1,63 @@
+"""
+Test suite for the OllamaEngine on-disk response cache.
+
+This module checks cache keys, hits and misses, and that unreadable or
+partially written entries never surface as cached responses.
+"""
+
+from adapters.engines.ollama_adapter.cache import _ResponseCache
+
+MESSAGES = [{"role": "user", "content": "Write chapter 1"}]
+
+
+def test_miss_then_hit(tmp_path):
+    """A stored response is returned for the same key only."""
+    cache = _ResponseCache(tmp_path / "cache")
+    key = cache.key("llama3.2", False, MESSAGES)
+    assert cache.get(key) is None
+    cache.put(key, "## Chapter 1\nBody")
+    assert cache.get(key) == "## Chapter 1\nBody"
+    assert cache.get(cache.key("llama3.2", True, MESSAGES)) is None
+
+
+def test_key_depends_on_request():
+    """Model, think setting and every message field change the key."""
+    key = _ResponseCache.key("llama3.2", False, MESSAGES)
+    assert key == _ResponseCache.key("llama3.2", False, [dict(MESSAGES[0])])
+    assert key != _ResponseCache.key("mistral", False, MESSAGES)
+    assert key != _ResponseCache.key("llama3.2", True, MESSAGES)
+    assert key != _ResponseCache.key(
+        "llama3.2", False, [{"role": "system", "content": "Write chapter 1"}]
+    )
+    # Field boundaries are delimited, so shifting text between them differs
+    assert _ResponseCache.key("a", False, [{"role": "b", "content": "c"}]) != (
+        _ResponseCache.key("a", False, [{"role": "bc", "content": ""}])
+    )
+
+
+def test_put_overwrites_without_leftovers(tmp_path):
+    """Rewriting an entry replaces it and leaves no temporary files."""
+    cache = _ResponseCache(tmp_path)
+    key = cache.key("llama3.2", False, MESSAGES)
+    cache.put(key, "first")
+    cache.put(key, "second")
+    assert cache.get(key) == "second"
+    assert [path.name for path in tmp_path.iterdir()] == [f"{key}.md"]
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    """An entry that is not valid UTF-8 is ignored and can be replaced."""
+    cache = _ResponseCache(tmp_path)
+    key = cache.key("llama3.2", False, MESSAGES)
+    (tmp_path / f"{key}.md").write_bytes(b"\xff\xfe partial \xc3")
+    assert cache.get(key) is None
+    cache.put(key, "regenerated")
+    assert cache.get(key) == "regenerated"
+
+
+def test_partial_write_is_not_visible(tmp_path):
+    """A temporary file left by an interrupted put() is not a cache hit."""
+    cache = _ResponseCache(tmp_path)
+    key = cache.key("llama3.2", False, MESSAGES)
+    (tmp_path / f"{key}.123.456.tmp").write_text("half a resp", encoding="utf-8")
+    assert cache.get(key) is None
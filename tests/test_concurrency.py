@@ -0,0 +1,125 @@
+"""
+Test suite for concurrent chapter generation.
+
+This module checks the shared private event loop driver and the concurrent
+OllamaEngine.iter_details() path against a fake async client, including
+more chapters than the concurrency limit allows at once.
+"""
+
+import asyncio
+
+import pytest
+from adapters.engines.concurrency import iter_concurrently
+from adapters.engines.ollama_adapter import DEFAULT_CONCURRENCY, OllamaEngine
+
+
+class FakeAsyncClient:
+    """Stand-in for ollama.AsyncClient that tracks requests in flight."""
+
+    in_flight = 0
+    peak = 0
+    closed = 0
+
+    def __init__(self, host=None):
+        self.host = host
+
+    async def chat(self, model, messages, stream, **kwargs):
+        """Answer a chapter request after a delay that varies by chapter."""
+        assert not stream and not kwargs
+        cls = type(self)
+        cls.in_flight += 1
+        cls.peak = max(cls.peak, cls.in_flight)
+        # Vary the delay by prompt so chapters complete out of order
+        await asyncio.sleep(0.001 * (10 - len(messages[-1]["content"]) % 10))
+        cls.in_flight -= 1
+        return {"message": {"content": f"{model} body"}, "eval_count": 3}
+
+    async def close(self):
+        """Record that the client was closed."""
+        type(self).closed += 1
+
+
+@pytest.fixture(name="fake_client")
+def fixture_fake_client(monkeypatch):
+    """Replace the Ollama async client with a fresh FakeAsyncClient class."""
+    client = type("Client", (FakeAsyncClient,), {})
+    monkeypatch.setattr("adapters.engines.ollama_adapter.AsyncClient", client)
+    return client
+
+
+def make_job(log, value, delay):
+    """Return a job recording how many jobs run at once."""
+    async def job():
+        log["running"] += 1
+        log["peak"] = max(log["peak"], log["running"])
+        await asyncio.sleep(delay)
+        log["running"] -= 1
+        return value
+    return job
+
+
+def test_iter_concurrently_limits_and_yields_in_completion_order():
+    """No more than the limit run at once, and faster jobs come out first."""
+    log = {"running": 0, "peak": 0}
+    closed = []
+
+    async def close():
+        closed.append(True)
+
+    jobs = [make_job(log, i, 0.005 * (5 - i)) for i in range(5)]
+    results = list(iter_concurrently(jobs, 2, close))
+    assert sorted(results) == [0, 1, 2, 3, 4]
+    assert results != [0, 1, 2, 3, 4]
+    assert log["peak"] == 2
+    assert closed == [True]
+
+
+def test_iter_concurrently_inside_running_loop():
+    """Callers already running an event loop can still iterate the results."""
+    log = {"running": 0, "peak": 0}
+
+    async def caller():
+        return list(iter_concurrently(
+            [make_job(log, i, 0.001) for i in range(4)], 3
+        ))
+
+    assert sorted(asyncio.run(caller())) == [0, 1, 2, 3]
+    assert log["peak"] == 3
+
+
+def test_iter_concurrently_cancels_on_early_stop():
+    """Stopping early cancels the jobs still running and closes resources."""
+    log = {"running": 0, "peak": 0}
+    closed = []
+
+    async def close():
+        closed.append(True)
+
+    results = iter_concurrently(
+        [make_job(log, 0, 0)] + [make_job(log, i, 10) for i in range(1, 4)], 4, close
+    )
+    assert next(results) == 0
+    results.close()
+    assert closed == [True]
+
+
+def test_ollama_iter_details_concurrently(fake_client):
+    """More chapters than the limit are all generated, at most two at a time."""
+    engine = OllamaEngine(model="llama3.2", stream=False, concurrency=2)
+    chapters = [{"full": f"Chapter {i}", "short": f"C{i}"} for i in range(1, 8)]
+    details = engine._generate_details("Python", chapters)  # pylint: disable=protected-access
+    assert [d.index for d in details] == list(range(1, 8))
+    assert [d.short_title for d in details] == [f"C{i}" for i in range(1, 8)]
+    assert all(d.content == "llama3.2 body" for d in details)
+    assert fake_client.peak == 2
+    assert fake_client.closed == 1
+    assert engine.tokens_used == 21
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("3", 3), ("0", 1), ("many", DEFAULT_CONCURRENCY), ("", DEFAULT_CONCURRENCY)
+])
+def test_ollama_parallel_env(monkeypatch, value, expected):
+    """OLLAMA_PARALLEL sets the default limit; invalid values are ignored."""
+    monkeypatch.setenv("OLLAMA_PARALLEL", value)
+    assert OllamaEngine(model="llama3.2").concurrency == expected
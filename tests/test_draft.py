@@ -0,0 +1,110 @@
+"""
+Test suite for OllamaEngine draft model generation.
+
+This module checks that the main model only reviews a draft model's
+chapter, that approved drafts are returned as they are, and that
+corrections are applied by the draft model, on both the sequential and
+the concurrent path.
+"""
+
+import pytest
+from adapters.engines.ollama_adapter import (
+    DRAFT_REVIEW_PROMPT, OllamaEngine
+)
+
+CHAPTERS = [{"full": f"Chapter {i}", "short": f"C{i}"} for i in range(1, 4)]
+
+
+def reply(calls, model, messages):
+    """Answer as the draft or main model and record the request.
+
+    The main model approves every chapter except Chapter 2, and the draft
+    model marks its revisions.
+    """
+    calls.append((model, messages))
+    prompt = messages[-1]["content"]
+    if model == "main":
+        assert prompt == DRAFT_REVIEW_PROMPT
+        if "Chapter 2" in messages[0]["content"]:
+            return "- Fix the example"
+        return "APPROVED"
+    if len(messages) > 1:
+        return f"revised: {prompt.rsplit(chr(10), 1)[-1]}"
+    return "draft"
+
+
+class FakeClient:  # pylint: disable=too-few-public-methods
+    """Stand-in for ollama.Client answering through reply()."""
+
+    def __init__(self):
+        self.calls = []
+
+    def chat(self, model, messages, stream, **_kwargs):
+        """Answer a chat request in one piece."""
+        assert not stream
+        content = reply(self.calls, model, messages)
+        return {"message": {"content": content}, "eval_count": 1}
+
+
+class FakeAsyncClient:
+    """Stand-in for ollama.AsyncClient answering through reply()."""
+
+    calls = []
+
+    def __init__(self, host=None):
+        self.host = host
+
+    async def chat(self, model, messages, stream, **_kwargs):
+        """Answer a chat request in one piece."""
+        assert not stream
+        content = reply(self.calls, model, messages)
+        return {"message": {"content": content}, "eval_count": 1}
+
+    async def close(self):
+        """Nothing to release."""
+
+
+@pytest.fixture(name="engine")
+def fixture_engine():
+    """An engine drafting with a "draft" model for a "main" model."""
+    return OllamaEngine(model="main", draft_model="draft", stream=False, concurrency=1)
+
+
+@pytest.mark.parametrize("review, approved", [
+    ("APPROVED", True), (" approved.\n", True), ("Approved!", True),
+    ("Not APPROVED", False), ("- Fix the example", False),
+])
+def test_draft_approved(review, approved):
+    """Only a bare approval accepts the draft."""
+    assert OllamaEngine._draft_approved(review) is approved  # pylint: disable=protected-access
+
+
+def test_approved_draft_is_returned_unchanged(engine):
+    """The main model only reviews, and an approved draft is used as is."""
+    engine.ollama = FakeClient()
+    content = engine.generate_content("Python", "Chapter 1", 1, 3, "C1")
+    assert content == "draft"
+    assert [model for model, _ in engine.ollama.calls] == ["draft", "main"]
+    review = engine.ollama.calls[1][1]
+    assert review[-2] == {"role": "assistant", "content": "draft"}
+
+
+def test_corrections_are_applied_by_draft_model(engine):
+    """A review with corrections sends them back to the draft model."""
+    engine.ollama = FakeClient()
+    content = engine.generate_content("Python", "Chapter 2", 2, 3, "C2")
+    assert content == "revised: - Fix the example"
+    assert [model for model, _ in engine.ollama.calls] == ["draft", "main", "draft"]
+    assert engine.tokens_used == 3
+
+
+def test_concurrent_draft_review(monkeypatch):
+    """The concurrent path reviews drafts the same way."""
+    client = type("Client", (FakeAsyncClient,), {"calls": []})
+    monkeypatch.setattr("adapters.engines.ollama_adapter.AsyncClient", client)
+    engine = OllamaEngine(model="main", draft_model="draft", stream=False, concurrency=2)
+    details = engine._generate_details("Python", CHAPTERS)  # pylint: disable=protected-access
+    assert [d.content for d in details] == [
+        "draft", "revised: - Fix the example", "draft"
+    ]
+    assert sorted(model for model, _ in client.calls) == ["draft"] * 4 + ["main"] * 3
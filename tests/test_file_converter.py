@@ -0,0 +1,170 @@
+"""
+Test suite for the FileConverter rebuild checks.
+
+This module runs conversions against a fake subprocess and checks that
+outputs built from identical sources are skipped, that changed sources
+or --force rebuild them, and that failed builds leave no hash sidecar.
+It also checks that commands are only formatted for emitted log messages.
+"""
+
+import logging
+import subprocess
+from pathlib import Path
+
+import pytest
+from adapters.file_converter import FileConverter
+
+METADATA = {"title": "Python", "author": "AI"}
+
+
+@pytest.fixture(name="converter")
+def fixture_converter():
+    """A FileConverter using the default theme."""
+    return FileConverter("default")
+
+
+@pytest.fixture(name="md_file")
+def fixture_md_file(tmp_path):
+    """A markdown file to convert."""
+    md_path = tmp_path / "course.md"
+    md_path.write_text("# Python\n\nBody\n", encoding="utf-8")
+    return md_path
+
+
+@pytest.fixture(name="commands")
+def fixture_commands(monkeypatch):
+    """Record conversion commands and fake their outputs.
+
+    Programs listed in ``failing`` exit with an error instead.
+    """
+    commands = {"run": [], "failing": set()}
+
+    def fake_run(cmd, check):
+        assert check
+        commands["run"].append(cmd)
+        if cmd[0] in commands["failing"]:
+            raise subprocess.CalledProcessError(1, cmd)
+        output = cmd[3] if cmd[0] == "pandoc" else cmd[2]
+        Path(output).write_text(cmd[0], encoding="utf-8")
+
+    monkeypatch.setattr("adapters.file_converter.subprocess.run", fake_run)
+    return commands
+
+
+def outputs(commands):
+    """Return the output suffixes of the recorded commands."""
+    return sorted(
+        Path(cmd[3] if cmd[0] == "pandoc" else cmd[2]).suffix for cmd in commands["run"]
+    )
+
+
+def test_source_digest_covers_markdown_metadata_and_theme(converter, md_file):
+    """The digest changes with the markdown, the metadata and the CSS."""
+    digest = converter._source_digest(md_file, METADATA)  # pylint: disable=protected-access
+    assert digest == converter._source_digest(  # pylint: disable=protected-access
+        md_file, dict(reversed(METADATA.items()))
+    )
+    assert digest != converter._source_digest(  # pylint: disable=protected-access
+        md_file, {**METADATA, "title": "Rust"}
+    )
+    themed = FileConverter("nord")
+    assert themed.css_file != converter.css_file
+    assert digest != themed._source_digest(md_file, METADATA)  # pylint: disable=protected-access
+    md_file.write_text("# Python\n\nOther body\n", encoding="utf-8")
+    assert digest != converter._source_digest(md_file, METADATA)  # pylint: disable=protected-access
+
+
+def test_is_up_to_date(tmp_path):
+    """An output is current only if it exists and its sidecar matches."""
+    output = tmp_path / "course.html"
+    sidecar = tmp_path / "course.html.hash"
+    assert not FileConverter._is_up_to_date(str(output), "abc")  # pylint: disable=protected-access
+    sidecar.write_text("abc", encoding="utf-8")
+    assert not FileConverter._is_up_to_date(str(output), "abc")  # pylint: disable=protected-access
+    output.write_text("html", encoding="utf-8")
+    assert FileConverter._is_up_to_date(str(output), "abc")  # pylint: disable=protected-access
+    assert not FileConverter._is_up_to_date(str(output), "abd")  # pylint: disable=protected-access
+
+
+def test_unchanged_source_is_skipped(converter, md_file, commands):
+    """A second conversion of the same sources runs no command."""
+    converter.convert(str(md_file), METADATA)
+    assert outputs(commands) == [".epub", ".html", ".pdf"]
+    assert all(Path(f"{md_file.with_suffix(ext)}.hash").exists()
+               for ext in (".html", ".epub", ".pdf"))
+    commands["run"].clear()
+    converter.convert(str(md_file), METADATA)
+    assert not commands["run"]
+
+
+def test_changed_metadata_rebuilds(converter, md_file, commands, caplog):
+    """New metadata makes every output stale again.
+
+    Stale outputs that exist are still protected unless forced.
+    """
+    converter.convert(str(md_file), METADATA)
+    commands["run"].clear()
+    changed = {**METADATA, "date": "2026-01-01"}
+    converter.convert(str(md_file), changed)
+    assert not commands["run"]
+    assert "Output file already exists" in caplog.text
+
+    for ext in (".html", ".epub", ".pdf"):
+        md_file.with_suffix(ext).unlink()
+    converter.convert(str(md_file), changed)
+    assert outputs(commands) == [".epub", ".html", ".pdf"]
+    commands["run"].clear()
+    converter.convert(str(md_file), changed)
+    assert not commands["run"]
+
+
+def test_force_rebuilds_up_to_date_outputs(converter, md_file, commands):
+    """--force runs every build even when the sidecars match."""
+    converter.convert(str(md_file), METADATA)
+    commands["run"].clear()
+    converter.convert(str(md_file), METADATA, force=True)
+    assert outputs(commands) == [".epub", ".html", ".pdf"]
+
+
+def test_failed_build_leaves_no_sidecar(converter, md_file, commands):
+    """A failing command writes no sidecar, so the next run retries it."""
+    commands["failing"].add("weasyprint")
+    converter.convert(str(md_file), METADATA)
+    assert not Path(f"{md_file.with_suffix('.pdf')}.hash").exists()
+    assert Path(f"{md_file.with_suffix('.html')}.hash").exists()
+
+    commands["failing"].clear()
+    commands["run"].clear()
+    converter.convert(str(md_file), METADATA)
+    assert outputs(commands) == [".pdf"]
+
+
+def test_failed_html_build_skips_pdf(converter, md_file, commands):
+    """The PDF is not rendered from, or recorded against, stale HTML."""
+    converter.convert(str(md_file), METADATA)
+    pdf_hash = Path(f"{md_file.with_suffix('.pdf')}.hash")
+    old_digest = pdf_hash.read_text(encoding="utf-8")
+    md_file.write_text("# Python\n\nNew body\n", encoding="utf-8")
+    commands["run"].clear()
+    commands["failing"].add("pandoc")
+    converter.convert(str(md_file), METADATA, force=True)
+    assert [cmd[0] for cmd in commands["run"]] == ["pandoc", "pandoc"]
+    assert pdf_hash.read_text(encoding="utf-8") == old_digest
+
+
+@pytest.mark.parametrize("level, joins", [
+    (logging.ERROR, 0), (logging.INFO, 1), (logging.DEBUG, 2)
+])
+def test_run_formats_command_only_when_logged(monkeypatch, caplog, level, joins):
+    """The command is only quoted for messages that are actually logged."""
+    joined = []
+
+    def fake_join(cmd):
+        joined.append(cmd)
+        return " ".join(cmd)
+
+    monkeypatch.setattr("adapters.file_converter.shlex.join", fake_join)
+    monkeypatch.setattr("adapters.file_converter.subprocess.run", lambda cmd, check: None)
+    caplog.set_level(level, logger="adapters.file_converter")
+    assert FileConverter._run(["pandoc", "a.md"])  # pylint: disable=protected-access
+    assert len(joined) == joins
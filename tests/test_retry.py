@@ -0,0 +1,67 @@
+"""
+Test suite for the OpenAIEngine retry backoff.
+
+This module checks that Retry-After headers are honoured and that other
+failures back off exponentially, with jitter, up to the cap.
+"""
+
+import httpx
+import pytest
+from openai import RateLimitError
+from adapters.engines.openai_adapter import (
+    MAX_RETRY_DELAY, RETRY_DELAY, _retry_delay
+)
+
+
+def rate_limit_error(headers):
+    """Build a RateLimitError carrying the given response headers."""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, headers=headers, request=request)
+    return RateLimitError("Rate limit reached", response=response, body=None)
+
+
+@pytest.fixture(name="no_jitter")
+def fixture_no_jitter(monkeypatch):
+    """Make the jitter factor 1 so delays are deterministic."""
+    monkeypatch.setattr("random.uniform", lambda low, high: 1.0)
+
+
+@pytest.mark.parametrize("attempt", [0, 2])
+def test_retry_after_is_honoured(attempt):
+    """A numeric Retry-After is used as is, whatever the attempt."""
+    assert _retry_delay(attempt, rate_limit_error({"retry-after": "7"})) == 7.0
+    assert _retry_delay(attempt, rate_limit_error({"retry-after": "0.5"})) == 0.5
+
+
+def test_retry_after_is_capped():
+    """A very long Retry-After is capped at MAX_RETRY_DELAY."""
+    error = rate_limit_error({"retry-after": "3600"})
+    assert _retry_delay(0, error) == MAX_RETRY_DELAY
+
+
+@pytest.mark.usefixtures("no_jitter")
+@pytest.mark.parametrize("headers", [
+    {},
+    {"retry-after": "soon"},
+    {"retry-after": "Wed, 21 Oct 2026 07:28:00 GMT"},
+])
+def test_malformed_retry_after_backs_off(headers):
+    """A missing or non-numeric Retry-After falls back to backoff."""
+    assert _retry_delay(1, rate_limit_error(headers)) == RETRY_DELAY * 2
+
+
+@pytest.mark.usefixtures("no_jitter")
+def test_backoff_grows_exponentially_up_to_cap():
+    """Delays double per attempt until they reach MAX_RETRY_DELAY."""
+    delays = [_retry_delay(attempt, ValueError("boom")) for attempt in range(8)]
+    assert delays[:3] == [RETRY_DELAY, RETRY_DELAY * 2, RETRY_DELAY * 4]
+    assert delays == sorted(delays)
+    assert delays[-1] == MAX_RETRY_DELAY
+
+
+@pytest.mark.parametrize("attempt", [0, 3, 10])
+def test_jitter_stays_within_bounds(attempt):
+    """Jitter scales the base delay by 0.5x to 1.5x."""
+    base = min(MAX_RETRY_DELAY, RETRY_DELAY * 2 ** attempt)
+    for _ in range(50):
+        assert 0.5 * base <= _retry_delay(attempt, OSError()) <= 1.5 * base
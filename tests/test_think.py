@@ -0,0 +1,45 @@
+"""
+Test suite for the OllamaEngine streaming <think> stripper.
+
+This module checks that think blocks are removed correctly even when the tags
+are split across streamed pieces.
+"""
+
+import pytest
+from adapters.engines.ollama_adapter.stream import _ThinkStripper
+
+
+def strip(pieces):
+    """Feed pieces through a fresh stripper and return the visible text."""
+    stripper = _ThinkStripper()
+    content = "".join(stripper.feed(piece) for piece in pieces)
+    return content + stripper.flush()
+
+
+@pytest.mark.parametrize("pieces", [
+    ["<think>plan</think>Answer"],
+    ["<thi", "nk>plan</th", "ink>Answer"],
+    ["<", "think", ">", "plan", "<", "/think", ">", "Answer"],
+    ["<THINK reason=\"x\">plan</Think>Answer"],
+])
+def test_think_block_removed(pieces):
+    """Think blocks are dropped wherever the tags are split."""
+    assert strip(pieces) == "Answer"
+
+
+def test_unterminated_think_block_kept():
+    """An unclosed think block is kept, as the regex pass would."""
+    assert strip(["Intro <think>still ", "thinking"]) == "Intro <think>still thinking"
+
+
+def test_similar_tags_are_kept():
+    """Tags that merely start with 'think' are not treated as think blocks."""
+    assert strip(["<thinking>", "x", "</thinking>"]) == "<thinking>x</thinking>"
+
+
+def test_word_count_matches_split():
+    """Words split across pieces are only counted once."""
+    stripper = _ThinkStripper()
+    for piece in ["<think>one tw", "o</think> three", " four\n"]:
+        stripper.feed(piece)
+    assert stripper.word_count == len("<think>one two</think> three four\n".split())